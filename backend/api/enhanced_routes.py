@@ -399,11 +399,11 @@ async def legacy_get_businesses(
             "name": business.business_name,
             "tagline": business.demo_highlights[0] if business.demo_highlights else "Historic San Francisco business",
             "type": business.business_type,
-            "neighborhood": business.neighborhood.value if business.neighborhood else "Unknown",
+            "neighborhood": business.neighborhood or "Unknown",
             "founded": business.founding_year,
             "story": business.founding_story,
             "features": business.unique_features,
-            "status": business.current_status.value,
+            "status": business.current_status,
             "heritage_score": business.heritage_score,
             "cultural_significance": business.cultural_significance
         }
@@ -206,6 +206,7 @@ class LlamaIndexMultiModalService:
         
         # Storage
         self.processed_documents: Dict[str, ProcessedDocument] = {}
+        self._document_json: Dict[str, str] = {}  # serialized once on store
         self.temp_dir = Path(tempfile.mkdtemp(prefix="llamaindex_"))
         
         # Configuration
@@ -457,7 +458,7 @@ class LlamaIndexMultiModalService:
             )
             
             # Store processed document
-            self.processed_documents[doc_metadata.document_id] = processed_doc
+            self._store_document(processed_doc)
             
             return {
                 "success": True,
@@ -471,6 +472,20 @@ class LlamaIndexMultiModalService:
             if local_path.exists():
                 local_path.unlink()
     
+    def _store_document(self, document: ProcessedDocument):
+        """Store a processed document along with its serialized JSON."""
+        document_id = document.metadata.document_id
+        self.processed_documents[document_id] = document
+        self._document_json[document_id] = document.model_dump_json()
+    
+    def get_document_json(self, document_id: str) -> Optional[str]:
+        """Serialized JSON for a stored document, or None if unknown."""
+        return self._document_json.get(document_id)
+    
+    def list_documents_json(self) -> List[str]:
+        """Serialized JSON for all stored documents, in insertion order."""
+        return list(self._document_json.values())
+    
     async def _download_document(self, url: str) -> Path:
         """Download document from URL to temporary file."""
         temp_file = self.temp_dir / f"doc_{int(time.time())}.pdf"
@@ -5,21 +5,27 @@ Modern FastAPI with proper CORS for Astro frontend
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html, get_swagger_ui_oauth2_redirect_html
+from fastapi.responses import HTMLResponse, Response
 from pydantic import BaseModel
-from typing import Dict, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import json
+import threading
 import time
 
 from .services import VendorService, BusinessService, get_config
 from .debug import debug_service
-from .llamaindex_service import get_llamaindex_service
-from services.pdf_processing_service import get_pdf_service
 from .weaviate_routes import router as weaviate_router
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Hack Stack API",
     description="Modern hackathon backend with progressive enhancement",
-    version="1.0.0"
+    version="1.0.0",
+    openapi_url=None,  # served from a cached blob below
 )
 
 # CORS for Astro frontend
@@ -35,12 +41,66 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON listings (applications, heritage scores, documents)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# The schema is static once all routes are registered, so it is built and
+# serialized once at startup and served as cached bytes afterwards
+_openapi_json: Optional[bytes] = None
+
+def _openapi_bytes() -> bytes:
+    global _openapi_json
+    if _openapi_json is None:
+        _openapi_json = json.dumps(app.openapi()).encode("utf-8")
+    return _openapi_json
+
+@app.on_event("startup")
+async def warm_openapi_schema():
+    """Generate JSON schemas for every model up front, not on the first /docs hit"""
+    _openapi_bytes()
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_schema() -> Response:
+    return Response(
+        content=_openapi_bytes(),
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"},
+    )
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui() -> HTMLResponse:
+    return get_swagger_ui_html(
+        openapi_url="/openapi.json",
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=app.swagger_ui_oauth2_redirect_url,
+        init_oauth=app.swagger_ui_init_oauth,
+        swagger_ui_parameters=app.swagger_ui_parameters,
+    )
+
+@app.get(app.swagger_ui_oauth2_redirect_url, include_in_schema=False)
+async def swagger_ui_redirect() -> HTMLResponse:
+    return get_swagger_ui_oauth2_redirect_html()
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc_ui() -> HTMLResponse:
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
+
 # Initialize services
 config = get_config()
 vendor_service = VendorService()
 business_service = BusinessService()
-llamaindex_service = get_llamaindex_service()
-pdf_service = get_pdf_service()
+
+# Document-processing services pull in the LlamaIndex stack, so they are
+# imported and initialized on first use rather than at startup
+@lru_cache(maxsize=1)
+def _llamaindex_service():
+    from .llamaindex_service import get_llamaindex_service
+    return get_llamaindex_service()
+
+@lru_cache(maxsize=1)
+def _pdf_service():
+    from services.pdf_processing_service import get_pdf_service
+    return get_pdf_service()
 
 # Request models
 class VendorRequest(BaseModel):
@@ -153,27 +213,8 @@ async def get_businesses_by_type(business_type: str, limit: int = 10):
 @app.get("/api/applications")
 async def get_legacy_applications(limit: int = 10):
     """Get legacy business applications with heritage documentation"""
-    businesses = business_service.get_businesses(limit)
-    
-    # Transform to highlight application-specific fields
-    applications = []
-    for business in businesses:
-        app = {
-            "application_number": business.get("application_number"),
-            "name": business.get("name"),
-            "neighborhood": business.get("neighborhood"),
-            "type": business.get("type"),
-            "established": business.get("established"),
-            "heritage_score": business.get("heritage_score"),
-            "community_impact": business.get("community_impact"),
-            "cultural_significance": business.get("cultural_significance"),
-            "historical_significance": business.get("historical_significance"),
-            "proof_of_establishment": business.get("proof_of_establishment"),
-            "supporting_evidence": business.get("supporting_evidence"),
-            "approval_status": business.get("status", "APPROVED"),
-            "compliance_status": business.get("compliance_status")
-        }
-        applications.append(app)
+    # Projected to application-specific fields once at load time
+    applications = business_service.get_applications(limit)
     
     return {
         "total_applications": len(applications),
@@ -236,86 +277,103 @@ class RAGQueryRequest(BaseModel):
     query: str
     max_results: int = 5
 
+def _top_names(top_businesses) -> str:
+    return ', '.join(b["business_name"] for b in top_businesses[:3])
+
+def _rag_traditional_response(top_businesses) -> str:
+    return f"Based on the legacy business registry, several businesses exemplify traditional practices: {_top_names(top_businesses)}. These establishments have maintained authentic cultural traditions for decades."
+
+def _rag_food_response(top_businesses) -> str:
+    food_businesses = [b for b in top_businesses if "food" in b["context"].lower() or "restaurant" in b["context"].lower()]
+    if food_businesses:
+        return f"The legacy food establishments include {_top_names(food_businesses)}. These businesses represent generations of culinary tradition and community gathering spaces."
+    return f"Found {len(top_businesses)} businesses related to your query about food and dining traditions."
+
+def _rag_history_response(top_businesses) -> str:
+    return f"Several historic businesses match your query: {_top_names(top_businesses)}. These establishments have witnessed San Francisco's transformation while maintaining their original character."
+
+def _rag_default_response(top_businesses) -> str:
+    return f"I found {len(top_businesses)} relevant legacy businesses: {_top_names(top_businesses)}. Each has unique cultural significance and contributes to San Francisco's diverse heritage landscape."
+
+# Response templates in priority order, selected by the first trigger found in
+# the lowercased query (substring match, so "historical" selects history)
+_RAG_TEMPLATES = (
+    (("traditional", "authentic"), _rag_traditional_response),
+    (("food", "restaurant"), _rag_food_response),
+    (("history", "historic"), _rag_history_response),
+)
+
+# Bounded LRU of RAG responses; the business data is static, so a repeated
+# query can be answered without rescoring
+RAG_CACHE_SIZE = 512
+_rag_cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+_rag_cache_lock = threading.Lock()
+
 @app.post("/api/v2/rag/query")
-async def simulate_rag_query(request: RAGQueryRequest):
+async def simulate_rag_query(request: RAGQueryRequest, response: Response):
     """
     Simulate RAG query processing for legacy business knowledge.
     
     Demonstrates semantic search over business narratives and context retrieval.
     """
+    # Keyed on the exact query since it is echoed back in the response
+    key = (request.query, request.max_results)
+    with _rag_cache_lock:
+        result = _rag_cache.get(key)
+        if result is not None:
+            _rag_cache.move_to_end(key)
+    
+    if result is not None:
+        response.headers["X-Cache"] = "HIT"
+        return result
     
+    result = _run_rag_query(request)
+    with _rag_cache_lock:
+        _rag_cache[key] = result
+        if len(_rag_cache) > RAG_CACHE_SIZE:
+            _rag_cache.popitem(last=False)
+    
+    response.headers["X-Cache"] = "MISS"
+    return result
+
+def _run_rag_query(request: RAGQueryRequest) -> Dict[str, Any]:
+    """Score businesses against the query and build the simulated RAG response"""
     query = request.query.lower()
     businesses = business_service.get_businesses(50)
     
-    # Simple relevance scoring based on query terms
+    # Relevance scoring over pre-lowered weighted fields
     relevant_businesses = []
     
-    for business in businesses:
-        score = 0
+    for business, score in business_service.score_rag_query(query, len(businesses)):
         context_parts = []
         
-        # Search across rich narrative fields
-        searchable_fields = {
-            "name": business.get("name", ""),
-            "founding_story": business.get("founding_story", ""),
-            "cultural_impact": business.get("cultural_impact", ""),
-            "unique_features": business.get("unique_features", ""),
-            "story": business.get("story", ""),  # fallback for older data
-            "cultural_significance": business.get("cultural_significance", ""),
-            "historical_significance": business.get("historical_significance", ""),
-            "features": " ".join(business.get("features", [])),
-            "notable_features": " ".join(business.get("notable_features", [])),
-            "keywords": " ".join(business.get("keywords", [])),
-            "neighborhood": business.get("neighborhood", ""),
-            "type": business.get("type", "")
-        }
+        # Build context from rich narrative fields
+        if business.get("founding_story"):
+            context_parts.append(f"Origin: {business.get('founding_story')[:200]}...")
+        elif business.get("story"):  # fallback
+            context_parts.append(f"Origin: {business.get('story')[:150]}...")
         
-        # Calculate relevance score with enhanced weighting
-        for field, content in searchable_fields.items():
-            if query in content.lower():
-                if field in ["name"]:
-                    score += 10
-                elif field in ["founding_story", "cultural_impact", "unique_features"]:
-                    score += 8  # High-value narrative content
-                elif field in ["cultural_significance", "historical_significance"]:
-                    score += 6
-                elif field in ["keywords", "notable_features"]:
-                    score += 5  # Structured searchable content
-                elif field in ["features", "type"]:
-                    score += 4
-                elif field in ["story"]:  # fallback field
-                    score += 3
-                else:
-                    score += 2
+        if business.get("cultural_impact"):
+            context_parts.append(f"Cultural Impact: {business.get('cultural_impact')[:200]}...")
+        elif business.get("cultural_significance"):  # fallback
+            context_parts.append(f"Cultural Impact: {business.get('cultural_significance')[:150]}...")
         
-        if score > 0:
-            # Build context from rich narrative fields
-            if business.get("founding_story"):
-                context_parts.append(f"Origin: {business.get('founding_story')[:200]}...")
-            elif business.get("story"):  # fallback
-                context_parts.append(f"Origin: {business.get('story')[:150]}...")
-            
-            if business.get("cultural_impact"):
-                context_parts.append(f"Cultural Impact: {business.get('cultural_impact')[:200]}...")
-            elif business.get("cultural_significance"):  # fallback
-                context_parts.append(f"Cultural Impact: {business.get('cultural_significance')[:150]}...")
-            
-            if business.get("unique_features"):
-                context_parts.append(f"Unique Features: {business.get('unique_features')[:200]}...")
-            elif business.get("features"):  # fallback
-                context_parts.append(f"Notable Features: {', '.join(business.get('features', [])[:3])}")
-            
-            if business.get("keywords"):
-                context_parts.append(f"Keywords: {', '.join(business.get('keywords', [])[:5])}")
-            
-            relevant_businesses.append({
-                "business_name": business.get("name"),
-                "context": " | ".join(context_parts),
-                "heritage_score": business.get("heritage_score"),
-                "relevance_score": score / 20.0,  # Normalize to 0-1
-                "neighborhood": business.get("neighborhood"),
-                "established": business.get("established")
-            })
+        if business.get("unique_features"):
+            context_parts.append(f"Unique Features: {business.get('unique_features')[:200]}...")
+        elif business.get("features"):  # fallback
+            context_parts.append(f"Notable Features: {', '.join(business.get('features', [])[:3])}")
+        
+        if business.get("keywords"):
+            context_parts.append(f"Keywords: {', '.join(business.get('keywords', [])[:5])}")
+        
+        relevant_businesses.append({
+            "business_name": business.get("name"),
+            "context": " | ".join(context_parts),
+            "heritage_score": business.get("heritage_score"),
+            "relevance_score": score / 20.0,  # Normalize to 0-1
+            "neighborhood": business.get("neighborhood"),
+            "established": business.get("established")
+        })
     
     # Sort by relevance
     relevant_businesses.sort(key=lambda x: x["relevance_score"], reverse=True)
@@ -324,21 +382,12 @@ async def simulate_rag_query(request: RAGQueryRequest):
     # Generate simulated response
     if not top_businesses:
         response = f"I couldn't find specific information about '{request.query}' in the legacy business database."
-    elif "traditional" in query or "authentic" in query:
-        business_names = [b["business_name"] for b in top_businesses[:3]]
-        response = f"Based on the legacy business registry, several businesses exemplify traditional practices: {', '.join(business_names)}. These establishments have maintained authentic cultural traditions for decades."
-    elif "food" in query or "restaurant" in query:
-        food_businesses = [b for b in top_businesses if "food" in b["context"].lower() or "restaurant" in b["context"].lower()]
-        if food_businesses:
-            response = f"The legacy food establishments include {', '.join([fb['business_name'] for fb in food_businesses[:3]])}. These businesses represent generations of culinary tradition and community gathering spaces."
-        else:
-            response = f"Found {len(top_businesses)} businesses related to your query about food and dining traditions."
-    elif "history" in query or "historic" in query:
-        business_names = [b["business_name"] for b in top_businesses[:3]]
-        response = f"Several historic businesses match your query: {', '.join(business_names)}. These establishments have witnessed San Francisco's transformation while maintaining their original character."
     else:
-        business_names = [b["business_name"] for b in top_businesses[:3]]
-        response = f"I found {len(top_businesses)} relevant legacy businesses: {', '.join(business_names)}. Each has unique cultural significance and contributes to San Francisco's diverse heritage landscape."
+        template = next(
+            (template for triggers, template in _RAG_TEMPLATES if any(t in query for t in triggers)),
+            _rag_default_response,
+        )
+        response = template(top_businesses)
     
     return {
         "success": True,
@@ -378,17 +427,9 @@ async def get_api_endpoints_status():
 @app.get("/api/debug/test/{vendor_name}")
 async def test_vendor_endpoint(vendor_name: str):
     """Test a specific vendor endpoint for debugging"""
-    test_request = VendorRequest(
-        operation="analyze",
-        data={"content": "Debug test - checking vendor connectivity"}
-    )
-    
     try:
-        result = await vendor_service.process(
-            vendor_name,
-            test_request.operation,
-            test_request.data
-        )
+        # Coalesced: a dashboard testing every vendor at once issues one call per vendor
+        result = await vendor_service.ping(vendor_name)
         return {
             "vendor": vendor_name,
             "status": "success",
@@ -410,7 +451,7 @@ async def test_vendor_endpoint(vendor_name: str):
 @app.get("/api/llamaindex/status")
 async def get_llamaindex_status():
     """Get LlamaIndex service status and capabilities"""
-    return llamaindex_service.get_service_status()
+    return _llamaindex_service().get_service_status()
 
 @app.post("/api/llamaindex/process")
 async def process_document(request: DocumentProcessRequest):
@@ -424,7 +465,7 @@ async def process_document(request: DocumentProcessRequest):
     - Quality scoring and validation
     """
     try:
-        result = await llamaindex_service.process_document_url(request.document_url)
+        result = await _llamaindex_service().process_document_url(request.document_url)
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -441,7 +482,7 @@ async def query_multimodal(request: MultiModalQueryRequest):
     - Unified result ranking
     """
     try:
-        result = await llamaindex_service.query_multimodal(
+        result = await _llamaindex_service().query_multimodal(
             query=request.query,
             document_id=request.document_id
         )
@@ -453,12 +494,12 @@ async def query_multimodal(request: MultiModalQueryRequest):
 async def list_processed_documents():
     """List all processed documents with metadata"""
     try:
-        documents = list(llamaindex_service.processed_documents.values())
-        return {
-            "success": True,
-            "documents": [doc.model_dump() for doc in documents],
-            "total": len(documents)
-        }
+        # Documents are serialized once when stored; just splice the cached JSON
+        documents = _llamaindex_service().list_documents_json()
+        return Response(
+            content=f'{{"success":true,"documents":[{",".join(documents)}],"total":{len(documents)}}}',
+            media_type="application/json",
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -466,14 +507,14 @@ async def list_processed_documents():
 async def get_processed_document(document_id: str):
     """Get specific processed document with full details"""
     try:
-        if document_id not in llamaindex_service.processed_documents:
+        document = _llamaindex_service().get_document_json(document_id)
+        if document is None:
             raise HTTPException(status_code=404, detail="Document not found")
         
-        document = llamaindex_service.processed_documents[document_id]
-        return {
-            "success": True,
-            "document": document.model_dump()
-        }
+        return Response(
+            content=f'{{"success":true,"document":{document}}}',
+            media_type="application/json",
+        )
     except HTTPException:
         raise
     except Exception as e:
@@ -530,7 +571,7 @@ async def get_demo_capabilities():
             "What images are mentioned in the conclusion?",
             "Search for flowcharts about the processing pipeline"
         ],
-        "service_status": llamaindex_service.get_service_status()
+        "service_status": _llamaindex_service().get_service_status()
     }
 
 # =============================================================================
@@ -540,7 +581,7 @@ async def get_demo_capabilities():
 @app.get("/api/pdf/status")
 async def get_pdf_service_status():
     """Get PDF processing service status and capabilities"""
-    return pdf_service.get_service_status()
+    return _pdf_service().get_service_status()
 
 @app.post("/api/pdf/process")
 async def process_pdf(request: PDFProcessRequest):
@@ -554,7 +595,7 @@ async def process_pdf(request: PDFProcessRequest):
     - Mock mode for development/demo
     """
     try:
-        result = await pdf_service.process_pdf_url(
+        result = await _pdf_service().process_pdf_url(
             pdf_url=request.pdf_url,
             store_metadata=request.store_metadata
         )
@@ -574,7 +615,7 @@ async def process_pdf_batch(request: BatchPDFProcessRequest):
     - Summary statistics
     """
     try:
-        result = await pdf_service.batch_process_pdfs(
+        result = await _pdf_service().batch_process_pdfs(
             pdf_urls=request.pdf_urls
         )
         return result
@@ -613,7 +654,7 @@ async def get_pdf_demo_capabilities():
     - Sample extraction results
     - Quality scoring examples
     """
-    service_status = pdf_service.get_service_status()
+    service_status = _pdf_service().get_service_status()
     
     demo_pdfs = []
     if service_status["mode"] == "mock":
@@ -672,6 +713,18 @@ async def get_pdf_demo_capabilities():
 app.include_router(weaviate_router)
 print("✅ Weaviate routes mounted at /api/weaviate")
 
+def _assert_unique_routes(app: FastAPI) -> None:
+    """Fail fast if a path/method pair is registered twice (the later one is dead code)"""
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (route.path, method)
+            if key in seen:
+                raise RuntimeError(f"Duplicate route registered: {method} {route.path}")
+            seen.add(key)
+
+_assert_unique_routes(app)
+
 # Mount enhanced API routes
 try:
     from .enhanced_routes import app as enhanced_app
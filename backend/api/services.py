@@ -3,18 +3,41 @@ Services - Business Logic and Vendor Integration
 Clean separation with Protocol-based vendor abstraction
 """
 
+import asyncio
+import logging
+import mmap
 import os
+import re
+import sys
 import json
+import time
 from datetime import datetime
-from typing import Protocol, Dict, Any, List, Optional
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Protocol, Dict, Any, Iterable, List, Mapping, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file from raw bytes, using orjson when it is installed"""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Configuration
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class VendorCredentials:
     """Tracks vendor credentials and their sources"""
     vendor: str
@@ -23,13 +46,14 @@ class VendorCredentials:
     is_secure: bool  # False if using host environment
     warning: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration with secure credential detection"""
     mode: str = "mock"
     debug: bool = True
     available_vendors: List[str] = None
     vendor_credentials: Dict[str, VendorCredentials] = None
+    _env_file_map: Dict[str, str] = field(default_factory=dict, init=False, repr=False)
     
     def __post_init__(self):
         if self.available_vendors is None:
@@ -44,6 +68,9 @@ class Config:
             self.mode = "mock"
             return
         
+        # Parse .env once; every credential check below is a dict lookup
+        self._env_file_map = self._load_env_file(Path("/app/.env"))
+        
         vendor_keys = {
             'openai': 'OPENAI_API_KEY',
             'anthropic': 'ANTHROPIC_API_KEY', 
@@ -79,29 +106,30 @@ class Config:
         # Set to mock until real implementations are added
         self.mode = "mock"
     
+    @staticmethod
+    def _load_env_file(env_file_path: Path) -> Dict[str, str]:
+        """Parse KEY=value lines from an env file; the first definition of a key wins"""
+        env_map = {}
+        try:
+            with open(env_file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return env_map  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    for line in iter(mm.readline, b""):
+                        line = line.strip()
+                        if not line or line.startswith(b'#') or b'=' not in line:
+                            continue
+                        key, value = line.split(b'=', 1)
+                        env_map.setdefault(key.decode('utf-8', 'replace'), value.strip().decode('utf-8', 'replace'))
+        except Exception:
+            pass  # Missing or unreadable; fall through to host detection
+        return env_map
+    
     def _determine_credential_source(self, env_var: str, key_value: str):
         """Actually determine where the credential is coming from"""
-        env_file_path = Path("/app/.env")
-        
-        # Check if .env file exists and contains this variable with a value
-        if env_file_path.exists():
-            try:
-                with open(env_file_path, 'r') as f:
-                    env_content = f.read()
-                    
-                # Look for the variable in .env file with a non-empty value
-                for line in env_content.splitlines():
-                    line = line.strip()
-                    if line.startswith(f'{env_var}='):
-                        # Extract value after the equals sign
-                        value = line[len(f'{env_var}='):].strip()
-                        # Only consider it from env file if it has an actual value
-                        if value and value != '':
-                            return "env_file", True, None
-                        break  # Found the variable but it's empty
-                    
-            except Exception:
-                pass  # Fall through to host detection
+        # Only consider it from env file if it has an actual value there
+        if self._env_file_map.get(env_var):
+            return "env_file", True, None
         
         # If we get here, key is from host environment (insecure)
         return "host_env", False, "Using host environment key - insecure! Use .env file instead"
@@ -119,6 +147,41 @@ def get_config() -> Config:
         _config = Config()
     return _config
 
+# =============================================================================
+# Caching
+# =============================================================================
+
+class TTLCache:
+    """Bounded LRU cache whose entries also expire after `ttl` seconds"""
+    
+    def __init__(self, maxsize: int = 512, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        value, expires_at = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key: Any, value: Any):
+        self._data[key] = (value, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def clear(self):
+        self._data.clear()
+
 # =============================================================================
 # Mock Data
 # =============================================================================
@@ -211,12 +274,31 @@ class MockVendor:
     async def process(self, operation: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Return realistic mock responses"""
         responses = MOCK_AI_RESPONSES.get(self.vendor_name, {})
-        return responses.get(operation, {
+        # Copy so callers can attach _meta without touching the shared mocks
+        return dict(responses.get(operation) or {
             "message": f"Mock response from {self.vendor_name}",
             "operation": operation,
             "mock": True
         })
 
+# Vendors the service can dispatch to
+_VALID_VENDORS = frozenset({"openai", "anthropic", "weaviate"})
+
+# Shape of the _meta block attached to every vendor response
+_META_TEMPLATE = {"vendor": None, "operation": None, "mode": "mock", "timestamp": None}
+
+# Vendor metadata timestamps are second-resolution; format once per second
+_TS_CACHE = [0, ""]
+
+def _ts() -> str:
+    """Current local time as an ISO string, cached for the current second"""
+    sec = int(time.time())
+    cache = _TS_CACHE
+    if cache[0] != sec:
+        cache[0] = sec
+        cache[1] = datetime.fromtimestamp(sec).isoformat()
+    return cache[1]
+
 class VendorService:
     """Service for managing AI vendor integrations"""
     
@@ -224,54 +306,162 @@ class VendorService:
         self.config = get_config()
         self.available_vendors = self.config.available_vendors
         self._vendors = {}
+        self._inflight_pings: Dict[str, asyncio.Future] = {}
         self._initialize_vendors()
     
     def _initialize_vendors(self):
         """Initialize available vendors"""
         # All vendors currently use mock implementations
         # Real vendor clients would be initialized here when implemented
-        for vendor in ["openai", "anthropic", "weaviate"]:
-            self._vendors[vendor] = MockVendor(vendor)
+        for vendor in sorted(_VALID_VENDORS):
+            self._vendors[sys.intern(vendor)] = MockVendor(vendor)
+    
+    async def ping(self, vendor_name: str) -> Dict[str, Any]:
+        """Connectivity check; concurrent pings of one vendor share a single call"""
+        pending = self._inflight_pings.get(vendor_name)
+        if pending is None:
+            pending = asyncio.ensure_future(
+                self.process(vendor_name, "analyze", {"content": "Debug test - checking vendor connectivity"})
+            )
+            self._inflight_pings[vendor_name] = pending
+            pending.add_done_callback(lambda _: self._inflight_pings.pop(vendor_name, None))
+        # Shield so one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(pending)
     
     async def process(self, vendor_name: str, operation: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Process request through vendor with automatic fallback"""
-        if vendor_name not in ["openai", "anthropic", "weaviate"]:
+        if vendor_name not in _VALID_VENDORS:
             raise ValueError(f"Unknown vendor: {vendor_name}")
         
         try:
             vendor = self._vendors[vendor_name]
             result = await vendor.process(operation, data)
             
-            # Add metadata
-            result["_meta"] = {
-                "vendor": vendor_name,
-                "operation": operation,
-                "mode": "mock",  # All vendors currently use mock implementations
-                "timestamp": datetime.now().isoformat()
-            }
+            # Add metadata; all vendors currently use mock implementations
+            meta = _META_TEMPLATE.copy()
+            meta["vendor"] = vendor_name
+            meta["operation"] = operation
+            meta["timestamp"] = _ts()
+            result["_meta"] = meta
             
             return result
             
         except Exception as e:
             # Graceful fallback
-            fallback = MockVendor(vendor_name)
-            result = await fallback.process(operation, data)
-            result["_meta"] = {
-                "vendor": vendor_name,
-                "operation": operation,
-                "mode": "mock_fallback",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat()
-            }
-            return result
+            return await self._fallback(vendor_name, operation, data, e)
+    
+    async def _fallback(self, vendor_name: str, operation: str, data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Mock response tagged with the error that forced the fallback"""
+        fallback = MockVendor(vendor_name)
+        result = await fallback.process(operation, data)
+        meta = _META_TEMPLATE.copy()
+        meta["vendor"] = vendor_name
+        meta["operation"] = operation
+        meta["mode"] = "mock_fallback"
+        meta["error"] = str(error)
+        meta["timestamp"] = _ts()
+        result["_meta"] = meta
+        return result
+
+# Field weights used by the RAG simulation to score a query match
+RAG_FIELD_WEIGHTS = (
+    ("name", 10),
+    ("founding_story", 8),
+    ("cultural_impact", 8),
+    ("unique_features", 8),
+    ("cultural_significance", 6),
+    ("historical_significance", 6),
+    ("keywords", 5),
+    ("notable_features", 5),
+    ("features", 4),
+    ("type", 4),
+    ("story", 3),  # fallback for older data
+    ("neighborhood", 2),
+)
+
+# Field weights used by BusinessService.search; zero-weight fields only admit
+# a business into the results without adding to its relevance score
+SEARCH_FIELD_WEIGHTS = (
+    ("name", 10),
+    ("tagline", 5),
+    ("founding_story", 8),  # High-value narrative content
+    ("cultural_impact", 8),
+    ("unique_features", 7),
+    ("story", 3),  # fallback field
+    ("type", 8),
+    ("neighborhood", 6),
+    ("features", 0),
+    ("notable_features", 0),
+    ("keywords", 5),  # Structured searchable content
+    ("amenities", 0),
+)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Short fields indexed for autocomplete-style prefix lookup (search_prefix)
+PREFIX_FIELDS = ("name", "tagline", "type", "neighborhood", "keywords")
+
+# Every text field any index is built from
+_TEXT_FIELDS = tuple(dict.fromkeys(field for field, _ in RAG_FIELD_WEIGHTS + SEARCH_FIELD_WEIGHTS))
+
+# Minimum seconds between dataset mtime checks
+RELOAD_CHECK_INTERVAL = 1.0
+
+# Registry application projection: (response key, source key). Missing source
+# keys default to None, except status which defaults to "APPROVED".
+APPLICATION_FIELDS = (
+    ("application_number", "application_number"),
+    ("name", "name"),
+    ("neighborhood", "neighborhood"),
+    ("type", "type"),
+    ("established", "established"),
+    ("heritage_score", "heritage_score"),
+    ("community_impact", "community_impact"),
+    ("cultural_significance", "cultural_significance"),
+    ("historical_significance", "historical_significance"),
+    ("proof_of_establishment", "proof_of_establishment"),
+    ("supporting_evidence", "supporting_evidence"),
+    ("approval_status", "status"),
+    ("compliance_status", "compliance_status"),
+)
+_APPLICATION_KEYS = tuple(key for key, _ in APPLICATION_FIELDS)
+_APPLICATION_DEFAULTS = {source: None for _, source in APPLICATION_FIELDS}
+_APPLICATION_DEFAULTS["status"] = "APPROVED"
+_get_application_fields = itemgetter(*(source for _, source in APPLICATION_FIELDS))
+
+def _searchable_text(value: Any) -> str:
+    """Lowercased text for a business field, joining list-valued fields"""
+    if not value:
+        return ""
+    if isinstance(value, list):
+        return " ".join(value).lower()
+    return str(value).lower()
 
 class BusinessService:
     """Service for business data operations with legacy business registry data"""
     
     def __init__(self):
-        self._cache = {}
+        self._cache = TTLCache(maxsize=512, ttl=300)
+        self._data_path: Optional[Path] = None
+        self._data_mtime: Optional[float] = None
+        self._next_reload_check = 0.0
         self._legacy_businesses = []
+        self._businesses: Tuple[Mapping[str, Any], ...] = ()
+        self._by_id: Dict[Any, Mapping[str, Any]] = {}
+        self._by_neighborhood: Dict[str, List[Mapping[str, Any]]] = {}
+        self._by_type: Dict[str, List[Mapping[str, Any]]] = {}
+        self._rag_fields: List[Tuple[Tuple[int, str], ...]] = []
+        self._applications: List[Dict[str, Any]] = []
+        self._neighborhoods: Tuple[str, ...] = ()
+        self._business_types: Tuple[str, ...] = ()
+        self._stats: Dict[str, Any] = {}
+        self._search_rows: List[Tuple[str, Tuple[Tuple[int, str], ...]]] = []
+        self._token_index: Dict[str, Dict[int, int]] = {}
+        self._prefix_tokens: List[str] = []
+        self._prefix_postings: Dict[str, List[int]] = {}
+        self._vocabulary: Tuple[str, List[int], List[str]] = ("", [], [])
         self._load_legacy_businesses()
+        self._build_indexes()
     
     def _load_legacy_businesses(self):
         """Load legacy business applications dataset from JSON file"""
@@ -279,177 +469,297 @@ class BusinessService:
             # Try enhanced dataset with rich narratives first
             enhanced_data_path = Path(__file__).parent.parent / "data" / "enhanced_legacy_businesses.json"
             if enhanced_data_path.exists():
-                with open(enhanced_data_path, 'r') as f:
-                    data = json.load(f)
-                    self._legacy_businesses = data.get("applications", [])
-                    print(f"✅ Loaded {len(self._legacy_businesses)} enhanced legacy businesses with rich narratives")
-                    return
+                self._track_data_file(enhanced_data_path)
+                data = _read_json(enhanced_data_path)
+                self._legacy_businesses = data.get("applications", [])
+                logger.info("✅ Loaded %d enhanced legacy businesses with rich narratives", len(self._legacy_businesses))
+                return
             
             # Try standard application-based dataset
             app_data_path = Path(__file__).parent.parent / "data" / "legacy_business_applications.json"
             if app_data_path.exists():
-                with open(app_data_path, 'r') as f:
-                    data = json.load(f)
-                    self._legacy_businesses = data.get("applications", [])
-                    print(f"✅ Loaded {len(self._legacy_businesses)} legacy business applications from registry")
-                    return
+                self._track_data_file(app_data_path)
+                data = _read_json(app_data_path)
+                self._legacy_businesses = data.get("applications", [])
+                logger.info("✅ Loaded %d legacy business applications from registry", len(self._legacy_businesses))
+                return
             
             # Fallback to old dataset
             data_path = Path(__file__).parent.parent / "data" / "legacy_businesses.json"
             if data_path.exists():
-                with open(data_path, 'r') as f:
-                    data = json.load(f)
-                    self._legacy_businesses = data.get("businesses", [])
-                    print(f"✅ Loaded {len(self._legacy_businesses)} legacy businesses from dataset")
+                self._track_data_file(data_path)
+                data = _read_json(data_path)
+                self._legacy_businesses = data.get("businesses", [])
+                logger.info("✅ Loaded %d legacy businesses from dataset", len(self._legacy_businesses))
             else:
-                print("⚠️ Legacy businesses dataset not found, using demo data")
+                logger.warning("⚠️ Legacy businesses dataset not found, using demo data")
                 self._legacy_businesses = DEMO_BUSINESSES
-        except Exception as e:
-            print(f"❌ Error loading legacy businesses: {e}")
+        except Exception:
+            logger.exception("❌ Error loading legacy businesses")
             self._legacy_businesses = DEMO_BUSINESSES
     
-    def get_businesses(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get businesses with caching and legacy data support"""
-        cache_key = f"businesses_{limit}"
-        
-        if cache_key not in self._cache:
-            # Use legacy businesses if available, otherwise fall back to demo data
-            businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
-            self._cache[cache_key] = businesses[:limit]
+    def _track_data_file(self, path: Path):
+        """Remember which dataset file was loaded so changes can be detected"""
+        self._data_path = path
+        self._data_mtime = path.stat().st_mtime
+    
+    def _maybe_reload(self):
+        """Reload the dataset and drop cached results when its file changes"""
+        if self._data_path is None:
+            return
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        self._next_reload_check = now + RELOAD_CHECK_INTERVAL
         
-        return self._cache[cache_key]
+        try:
+            mtime = self._data_path.stat().st_mtime
+        except OSError:
+            return  # Keep serving the data already loaded
+        if mtime != self._data_mtime:
+            self._load_legacy_businesses()
+            self._build_indexes()
+            self._cache.clear()
     
-    def get_business_by_id(self, business_id: int) -> Dict[str, Any] | None:
-        """Get single business by ID from legacy dataset"""
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
+    def _build_indexes(self):
+        """Build lookup indexes and pre-lowered search fields once per load"""
+        # Records are handed out as read-only views so no caller can corrupt
+        # the shared dataset or the indexes built over it
+        businesses = tuple(
+            MappingProxyType(business)
+            for business in (self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES)
+        )
+        self._businesses = businesses
         
+        # Records without an id are skipped; on duplicate ids the first record
+        # wins, matching the linear scan this index replaced
+        self._by_id = {}
         for business in businesses:
-            if business.get("id") == business_id:
-                return business
-        return None
-    
-    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Enhanced search with legacy business data"""
-        query_lower = query.lower()
-        results = []
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
+            if "id" in business:
+                self._by_id.setdefault(business["id"], business)
         
+        by_neighborhood = defaultdict(list)
+        by_type = defaultdict(list)
         for business in businesses:
-            # Search across multiple fields including rich narratives
-            searchable_fields = [
-                business.get("name", ""),
-                business.get("tagline", ""),
-                business.get("founding_story", ""),
-                business.get("cultural_impact", ""),
-                business.get("unique_features", ""),
-                business.get("story", ""),  # fallback
-                business.get("type", ""),
-                business.get("neighborhood", ""),
-                " ".join(business.get("features", [])),
-                " ".join(business.get("notable_features", [])),
-                " ".join(business.get("keywords", [])),
-                " ".join(business.get("amenities", []))
-            ]
-            
-            searchable_text = " ".join(searchable_fields).lower()
-            
-            if query_lower in searchable_text:
-                # Add relevance score based on where the match was found
-                score = 0
-                if query_lower in business.get("name", "").lower():
-                    score += 10
-                if query_lower in business.get("tagline", "").lower():
-                    score += 5
-                if query_lower in business.get("founding_story", "").lower():
-                    score += 8  # High-value narrative content
-                if query_lower in business.get("cultural_impact", "").lower():
-                    score += 8  # High-value narrative content
-                if query_lower in business.get("unique_features", "").lower():
-                    score += 7  # High-value narrative content
-                if query_lower in business.get("type", "").lower():
-                    score += 8
-                if query_lower in business.get("neighborhood", "").lower():
-                    score += 6
-                if query_lower in " ".join(business.get("keywords", [])).lower():
-                    score += 5  # Structured searchable content
-                if query_lower in business.get("story", "").lower():
-                    score += 3  # fallback field
-                
-                business_with_score = business.copy()
-                business_with_score["_search_score"] = score
-                results.append(business_with_score)
+            by_neighborhood[business.get("neighborhood", "").lower()].append(business)
+            by_type[business.get("type", "").lower()].append(business)
+        self._by_neighborhood = dict(by_neighborhood)
+        self._by_type = dict(by_type)
         
-        # Sort by relevance score
-        results.sort(key=lambda x: x.get("_search_score", 0), reverse=True)
+        # Aggregates are fixed for a given load, so compute them once
+        self._neighborhoods = tuple(sorted({b["neighborhood"] for b in businesses if b.get("neighborhood")}))
+        self._business_types = tuple(sorted({b["type"] for b in businesses if b.get("type")}))
         
-        # Remove search score from final results
-        for result in results:
-            result.pop("_search_score", None)
+        ratings = [b["rating"] for b in businesses if b.get("rating")]
+        avg_rating = sum(ratings) / len(ratings) if ratings else 0
+        self._stats = {
+            "total_businesses": len(businesses),
+            "active_businesses": sum(1 for b in businesses if b.get("status") == "active"),
+            "total_neighborhoods": len(self._neighborhoods),
+            "total_types": len(self._business_types),
+            "average_rating": round(avg_rating, 1) if avg_rating else None,
+            "data_source": "legacy_registry" if self._legacy_businesses else "demo_data"
+        }
         
-        return results[:limit]
-    
-    def get_businesses_by_neighborhood(self, neighborhood: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get businesses filtered by neighborhood"""
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
+        # Project application records once; normalizing against the defaults
+        # lets a single itemgetter pull every field without KeyError
+        self._applications = [
+            dict(zip(_APPLICATION_KEYS, _get_application_fields({**_APPLICATION_DEFAULTS, **business})))
+            for business in businesses
+        ]
         
-        results = [
-            business for business in businesses 
-            if business.get("neighborhood", "").lower() == neighborhood.lower()
+        # Lowercase text fields, joining list-valued ones, once per business;
+        # every text index below reads from these
+        lowered = [
+            {name: _searchable_text(business.get(name)) for name in _TEXT_FIELDS}
+            for business in businesses
         ]
         
-        return results[:limit]
-    
-    def get_businesses_by_type(self, business_type: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get businesses filtered by type/category"""
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
+        # Pre-lowered search fields plus one joined blob per business, used as
+        # the substring admit test. Kept beside the records rather than on
+        # them so API responses stay unchanged.
+        self._search_rows = []
+        for text_fields in lowered:
+            fields = tuple((weight, text_fields[name]) for name, weight in SEARCH_FIELD_WEIGHTS)
+            blob = " ".join(text for _, text in fields)
+            self._search_rows.append((blob, tuple((w, t) for w, t in fields if w and t)))
+        
+        # Inverted index: token -> {business index: summed field weight}
+        token_index: Dict[str, Dict[int, int]] = {}
+        for idx, text_fields in enumerate(lowered):
+            for name, weight in SEARCH_FIELD_WEIGHTS:
+                for token in set(_TOKEN_RE.findall(text_fields[name])):
+                    postings = token_index.setdefault(token, {})
+                    postings[idx] = postings.get(idx, 0) + weight
+        self._token_index = token_index
+        
+        # Every indexed token in one newline-separated string with start
+        # offsets, so tokens containing a query word take one str.find scan
+        vocabulary = list(token_index)
+        offsets, position = [], 0
+        for token in vocabulary:
+            offsets.append(position)
+            position += len(token) + 1
+        self._vocabulary = ("\n".join(vocabulary), offsets, vocabulary)
         
-        results = [
-            business for business in businesses 
-            if business.get("type", "").lower() == business_type.lower()
+        # Sorted token list for prefix lookup by bisection
+        prefix_postings = defaultdict(list)
+        for idx, text_fields in enumerate(lowered):
+            tokens = set()
+            for name in PREFIX_FIELDS:
+                tokens.update(_TOKEN_RE.findall(text_fields[name]))
+            for token in tokens:
+                prefix_postings[token].append(idx)
+        self._prefix_postings = dict(prefix_postings)
+        self._prefix_tokens = sorted(prefix_postings)
+        
+        # Pre-lower the weighted RAG fields so queries never re-lower text
+        self._rag_fields = [
+            tuple(
+                (weight, text_fields[name])
+                for name, weight in RAG_FIELD_WEIGHTS
+                if text_fields[name]
+            )
+            for text_fields in lowered
         ]
+    
+    def score_rag_query(self, query: str, limit: int = 50) -> List[Tuple[Mapping[str, Any], int]]:
+        """Score the first `limit` businesses against a query, keeping matches only"""
+        query_lower = query.lower()
+        businesses = self.get_businesses(limit)
         
-        return results[:limit]
+        scored = []
+        for business, fields in zip(businesses, self._rag_fields):
+            score = sum(weight for weight, text in fields if query_lower in text)
+            if score > 0:
+                scored.append((business, score))
+        return scored
     
-    def get_neighborhoods(self) -> List[str]:
-        """Get list of all unique neighborhoods"""
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
-        neighborhoods = set()
+    def get_businesses(self, limit: int = 10) -> Tuple[Mapping[str, Any], ...]:
+        """Get businesses (legacy data, or demo data as a fallback) as read-only mappings"""
+        self._maybe_reload()
+        return self._businesses[:limit]
+    
+    def get_applications(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """Get businesses projected to registry application fields"""
+        self._maybe_reload()
+        return self._applications[:limit]
+    
+    def get_business_by_id(self, business_id: int) -> Mapping[str, Any] | None:
+        """Get single business by ID from legacy dataset"""
+        self._maybe_reload()
+        return self._by_id.get(business_id)
+    
+    def search(self, query: str, limit: int = 10) -> Tuple[Mapping[str, Any], ...]:
+        """
+        Enhanced search with legacy business data.
         
-        for business in businesses:
-            if business.get("neighborhood"):
-                neighborhoods.add(business["neighborhood"])
+        A business matches when the query is a substring of its searchable
+        text, and scores the summed weights of the fields containing it.
+        The token index only narrows which businesses are checked. Results
+        are cached, so they come back as a shared tuple.
+        """
+        self._maybe_reload()
+        query_lower = query.lower()
+        cache_key = ("search", query_lower, limit)
+        results = self._cache.get(cache_key)
+        if results is not None:
+            return results
         
-        return sorted(list(neighborhoods))
-    
-    def get_business_types(self) -> List[str]:
-        """Get list of all unique business types"""
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
-        types = set()
+        rows = self._search_rows
+        scores = {}
+        if not query_lower:
+            # The empty string is in every field: all businesses tie
+            scores = dict.fromkeys(range(len(rows)), 0)
+        else:
+            for idx in self._substring_candidates(query_lower):
+                blob, fields = rows[idx]
+                if query_lower in blob:
+                    scores[idx] = sum(weight for weight, text in fields if query_lower in text)
         
-        for business in businesses:
-            if business.get("type"):
-                types.add(business["type"])
+        results = tuple(self._rank(scores, limit))
+        self._cache[cache_key] = results
+        return results
+    
+    def _substring_candidates(self, query_lower: str) -> Iterable[int]:
+        """
+        Businesses that could contain query_lower as a substring. Each word
+        of the query lies inside some word of any text that contains it, so
+        a match needs, for every query word, an indexed token containing it.
+        """
+        candidates = None
+        for word in dict.fromkeys(_TOKEN_RE.findall(query_lower)):
+            matched = set()
+            for token in self._tokens_containing(word):
+                matched.update(self._token_index[token])
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return ()
+        # No word characters in the query: nothing to narrow by
+        return range(len(self._search_rows)) if candidates is None else sorted(candidates)
+    
+    def _tokens_containing(self, word: str) -> List[str]:
+        """Indexed tokens that have `word` as a substring"""
+        blob, offsets, tokens = self._vocabulary
+        found = []
+        start = blob.find(word)
+        while start != -1:
+            index = bisect_right(offsets, start) - 1
+            found.append(tokens[index])
+            # Resume after this token; further hits inside it add nothing
+            start = blob.find(word, offsets[index] + len(tokens[index]) + 1)
+        return found
+    
+    def search_prefix(self, prefix: str, limit: int = 10) -> List[Mapping[str, Any]]:
+        """Autocomplete search over name, tagline, type, neighborhood and keywords"""
+        self._maybe_reload()
+        return self._rank(self._score_prefix(prefix.lower()), limit)
+    
+    def _rank(self, scores: Dict[int, int], limit: int) -> List[Mapping[str, Any]]:
+        """Businesses by descending score, keeping dataset order for ties"""
+        businesses = self._businesses
+        # Plain (-score, idx) tuples compare in C without a Python key function
+        ranked = [(-score, idx) for idx, score in scores.items()]
+        ranked.sort()
+        return [businesses[idx] for _, idx in ranked[:limit]]
+    
+    def _score_prefix(self, prefix: str) -> Dict[int, int]:
+        """Score businesses with an indexed token starting with prefix"""
+        scores: Dict[int, int] = {}
+        if not prefix:
+            return scores
         
-        return sorted(list(types))
+        tokens = self._prefix_tokens
+        for i in range(bisect_left(tokens, prefix), len(tokens)):
+            token = tokens[i]
+            if not token.startswith(prefix):
+                break
+            weights = self._token_index[token]
+            for idx in self._prefix_postings[token]:
+                scores[idx] = max(scores.get(idx, 0), weights[idx])
+        return scores
+    
+    def get_businesses_by_neighborhood(self, neighborhood: str, limit: int = 10) -> List[Mapping[str, Any]]:
+        """Get businesses filtered by neighborhood"""
+        self._maybe_reload()
+        return self._by_neighborhood.get(neighborhood.lower(), [])[:limit]
+    
+    def get_businesses_by_type(self, business_type: str, limit: int = 10) -> List[Mapping[str, Any]]:
+        """Get businesses filtered by type/category"""
+        self._maybe_reload()
+        return self._by_type.get(business_type.lower(), [])[:limit]
+    
+    def get_neighborhoods(self) -> Tuple[str, ...]:
+        """Get list of all unique neighborhoods"""
+        self._maybe_reload()
+        return self._neighborhoods
+    
+    def get_business_types(self) -> Tuple[str, ...]:
+        """Get list of all unique business types"""
+        self._maybe_reload()
+        return self._business_types
     
     def get_stats(self) -> Dict[str, Any]:
         """Get business statistics"""
-        businesses = self._legacy_businesses if self._legacy_businesses else DEMO_BUSINESSES
-        
-        total = len(businesses)
-        active = len([b for b in businesses if b.get("status") == "active"])
-        neighborhoods = len(self.get_neighborhoods())
-        types = len(self.get_business_types())
-        
-        # Calculate average rating
-        ratings = [b.get("rating", 0) for b in businesses if b.get("rating")]
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-        
-        return {
-            "total_businesses": total,
-            "active_businesses": active,
-            "total_neighborhoods": neighborhoods,
-            "total_types": types,
-            "average_rating": round(avg_rating, 1) if avg_rating else None,
-            "data_source": "legacy_registry" if self._legacy_businesses else "demo_data"
-        }
\ No newline at end of file
+        self._maybe_reload()
+        return dict(self._stats)
@@ -10,18 +10,123 @@ Provides RESTful endpoints for Weaviate operations:
 """
 
 from fastapi import APIRouter, HTTPException, Query, Depends
-from fastapi.responses import JSONResponse
-from typing import Dict, Any, List, Optional
-from datetime import datetime
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from typing import AsyncIterator, Awaitable, Callable, Dict, Any, List, Optional, Tuple, Union
+from datetime import datetime, timezone
+from operator import attrgetter
+import asyncio
+import json
 import logging
+import time
 
-from models.legacy_business import LegacyBusinessSummary, LegacyBusinessSearch
-from services.weaviate_service import get_weaviate_service, WeaviateService, MockWeaviateService, WeaviateQueryAgent, SearchMode
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from models.legacy_business import LegacyBusinessSummary, LegacyBusinessSearch, dump_summaries_json
+from services.weaviate_service import get_weaviate_service, get_query_agent, WeaviateService, MockWeaviateService, SearchMode, SearchResponse
+from services.semantic_cache import SemanticCache, Singleflight
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/weaviate", tags=["weaviate"])
 
+class _JSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed
+
+    Handlers below assemble JSON-native dicts themselves, so they return
+    this directly and skip FastAPI's response-model encoding pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(content)
+        return super().render(content)
+
+# Serialized payloads for repeated queries (ignoring case and spacing);
+# the echoed query/question is swapped back in on a hit
+_search_cache = SemanticCache(maxsize=1024, ttl=300)
+_quick_search_cache = SemanticCache(maxsize=1024, ttl=300)
+_question_cache = SemanticCache(maxsize=512, ttl=300)
+
+# Concurrent misses on the same cache key share one backend call
+_search_flights = Singleflight()
+_quick_search_flights = Singleflight()
+_question_flights = Singleflight()
+
+
+# Health timestamps are second-resolution; format once per second so
+# probe storms reuse the same string
+_ISO_CACHE = [0, ""]
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO string, cached for the current second"""
+    sec = int(time.time())
+    cache = _ISO_CACHE
+    if cache[0] != sec:
+        cache[0] = sec
+        cache[1] = datetime.fromtimestamp(sec, timezone.utc).isoformat()
+    return cache[1]
+
+
+# Shared error details. Exceptions are still raised as fresh instances: a
+# module-level HTTPException re-raised from many requests would keep
+# growing its __traceback__ and share __context__ between them
+_NO_CONNECTION = "Cannot connect to Weaviate service"
+_QUESTION_REQUIRED = "Question is required"
+
+
+async def get_connected_service() -> Union[WeaviateService, MockWeaviateService]:
+    """Dependency returning the Weaviate service, connecting the live client if needed"""
+    service = get_weaviate_service()
+    
+    try:
+        await service.ensure_connected()
+    except ConnectionError:
+        raise HTTPException(status_code=503, detail=_NO_CONNECTION)
+    
+    return service
+
+
+# Short-lived cache for slow-moving backend reads (collection status, sample
+# businesses); the lock makes concurrent misses share a single fetch
+SNAPSHOT_TTL = 30.0
+_snapshots: Dict[str, Tuple[float, Any]] = {}
+_snapshot_lock = asyncio.Lock()
+
+
+async def _cached_snapshot(key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Return the cached value for `key`, refreshing it via `fetch` once expired"""
+    entry = _snapshots.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    
+    async with _snapshot_lock:
+        entry = _snapshots.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        value = await fetch()
+        _snapshots[key] = (time.monotonic() + SNAPSHOT_TTL, value)
+        return value
+
+
+@router.on_event("startup")
+async def connect_weaviate():
+    """Open the shared Weaviate client once so requests never pay the handshake"""
+    try:
+        await get_weaviate_service().ensure_connected()
+    except ConnectionError:
+        logger.warning("Weaviate unavailable at startup; will retry on first request")
+
+
+@router.on_event("shutdown")
+async def close_weaviate():
+    """Close the shared Weaviate client"""
+    get_weaviate_service().close()
+
 
 @router.get("/health", response_model=Dict[str, Any])
 async def get_weaviate_health():
@@ -29,70 +134,140 @@ async def get_weaviate_health():
     try:
         service = get_weaviate_service()
         
-        # For live service, test connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    return JSONResponse(
-                        status_code=503,
-                        content={
-                            "status": "unhealthy",
-                            "mode": "live",
-                            "error": "Cannot connect to Weaviate",
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    )
+        # For live service, test connection (a no-op in mock mode)
+        try:
+            await service.ensure_connected()
+        except ConnectionError:
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "status": "unhealthy",
+                    "mode": "live",
+                    "error": "Cannot connect to Weaviate",
+                    "timestamp": _utc_now_iso()
+                }
+            )
         
         status = await service.get_service_status()
         status["status"] = "healthy"
-        status["timestamp"] = datetime.utcnow().isoformat()
+        status["timestamp"] = _utc_now_iso()
         
         return status
         
     except Exception as e:
-        logger.error(f"Health check failed: {e}")
+        logger.error("Health check failed: %s", e)
         return JSONResponse(
             status_code=503,
             content={
                 "status": "unhealthy",
                 "error": str(e),
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": _utc_now_iso()
             }
         )
 
 
 @router.get("/businesses", response_model=List[LegacyBusinessSummary])
 async def list_all_businesses(
-    limit: int = Query(50, ge=1, le=100, description="Maximum number of businesses to return")
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of businesses to return"),
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
 ):
     """List all businesses from Weaviate with pagination"""
     try:
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
         businesses = await service.list_all_businesses(limit=limit)
-        return businesses
+        # Serialize in one pydantic-core pass instead of re-validating
+        # against response_model
+        return Response(content=dump_summaries_json(businesses), media_type="application/json")
         
     except Exception as e:
-        logger.error(f"Failed to list businesses: {e}")
+        logger.error("Failed to list businesses: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve businesses: {str(e)}"
         )
 
 
-@router.post("/search", response_model=Dict[str, Any])
-async def search_businesses(search_request: LegacyBusinessSearch):
+async def _ndjson_stream(businesses: AsyncIterator[LegacyBusinessSummary]) -> AsyncIterator[bytes]:
+    """Encode businesses as newline-delimited JSON as they arrive"""
+    try:
+        async for business in businesses:
+            if ORJSON_AVAILABLE:
+                yield orjson.dumps(business.json_dict) + b"\n"
+            else:
+                yield json.dumps(business.json_dict).encode() + b"\n"
+    except Exception as e:
+        # Headers are already sent; all we can do is end the stream early
+        logger.error("Business stream failed: %s", e)
+
+
+@router.get("/businesses/stream")
+async def stream_all_businesses(
+    limit: int = Query(50, ge=1, le=100, description="Maximum number of businesses to return"),
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
+    """
+    Stream businesses as NDJSON, one object per line.
+    
+    Records are sent as Weaviate returns each page, so the first business
+    reaches the client before the rest are fetched.
+    """
+    return StreamingResponse(
+        _ndjson_stream(service.iter_all_businesses(limit=limit)),
+        media_type="application/x-ndjson"
+    )
+
+
+def _search_payload(search_response: SearchResponse) -> Dict[str, Any]:
+    """Serialize a SearchResponse into the /search response body"""
+    return {
+        "results": [
+            {
+                "business": result.business.json_dict,
+                "score": result.score,
+                "certainty": result.certainty,
+                "distance": result.distance,
+                "confidence": result.confidence,
+                "search_mode": result.search_mode
+            }
+            for result in search_response.results
+        ],
+        "query": search_response.query,
+        "total_count": search_response.total_count,
+        "execution_time_ms": search_response.execution_time_ms,
+        "average_confidence": search_response.average_confidence,
+        "search_mode": search_response.search_mode.value,
+        "used_fallback": search_response.used_fallback,
+        "has_results": search_response.has_results
+    }
+
+
+async def _cached_search(
+    service: Union[WeaviateService, MockWeaviateService],
+    search_request: LegacyBusinessSearch
+) -> Dict[str, Any]:
+    """/search payload from the cache, or from one shared backend call on a miss"""
+    query = search_request.query
+    filters = search_request.model_dump_json(exclude={"query"})
+    payload = _search_cache.lookup(query, filters)
+    
+    if payload is None:
+        async def fetch():
+            search_response = await service.search_businesses(search_request)
+            result = _search_payload(search_response)
+            _search_cache.store(query, filters, result)
+            return result
+        
+        payload = await _search_flights.do(_search_cache.key(query, filters), fetch)
+    
+    # Queries differing only in case or spacing share a payload; echo back
+    # this caller's wording
+    return payload if payload["query"] == query else {**payload, "query": query}
+
+
+@router.post("/search", response_class=_JSONResponse)
+async def search_businesses(
+    search_request: LegacyBusinessSearch,
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
     """
     Perform semantic search across legacy business data.
     
@@ -105,65 +280,57 @@ async def search_businesses(search_request: LegacyBusinessSearch):
     - Configurable similarity thresholds
     """
     try:
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
-        search_response = await service.search_businesses(search_request)
-        
-        return {
-            "results": [
-                {
-                    "business": result.business.dict(),
-                    "score": result.score,
-                    "certainty": result.certainty,
-                    "distance": result.distance,
-                    "confidence": result.confidence,
-                    "search_mode": result.search_mode
-                }
-                for result in search_response.results
-            ],
-            "query": search_response.query,
-            "total_count": search_response.total_count,
-            "execution_time_ms": search_response.execution_time_ms,
-            "average_confidence": search_response.average_confidence,
-            "search_mode": search_response.search_mode.value,
-            "used_fallback": search_response.used_fallback,
-            "has_results": search_response.has_results
-        }
+        return _JSONResponse(await _cached_search(service, search_request))
         
     except Exception as e:
-        logger.error(f"Search failed: {e}")
+        logger.error("Search failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Search failed: {str(e)}"
         )
 
 
+MAX_BATCH_SEARCHES = 48
+
+
+@router.post("/search/batch", response_class=_JSONResponse)
+async def search_businesses_batch(
+    search_requests: List[LegacyBusinessSearch],
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
+    """
+    Run several searches in one round trip.
+    
+    Cached queries are answered directly; the rest run concurrently against
+    the shared Weaviate connection. Results are returned in request order.
+    """
+    if len(search_requests) > MAX_BATCH_SEARCHES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_SEARCHES} searches per batch"
+        )
+    
+    try:
+        payloads = await asyncio.gather(
+            *(_cached_search(service, search_request) for search_request in search_requests)
+        )
+        return _JSONResponse(payloads)
+        
+    except Exception as e:
+        logger.error("Batch search failed: %s", e)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Batch search failed: {str(e)}"
+        )
+
+
 @router.get("/businesses/{business_name}", response_model=Optional[LegacyBusinessSummary])
-async def get_business_by_name(business_name: str):
+async def get_business_by_name(
+    business_name: str,
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
     """Get a specific business by name"""
     try:
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
         business = await service.get_business_by_name(business_name)
         
         if not business:
@@ -177,66 +344,72 @@ async def get_business_by_name(business_name: str):
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get business: {e}")
+        logger.error("Failed to get business: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve business: {str(e)}"
         )
 
 
-@router.get("/businesses/{business_name}/similar", response_model=List[Dict[str, Any]])
+@router.get("/businesses/{business_name}/similar", response_class=_JSONResponse)
 async def get_similar_businesses(
     business_name: str,
-    limit: int = Query(5, ge=1, le=20, description="Maximum number of similar businesses to return")
+    limit: int = Query(5, ge=1, le=20, description="Maximum number of similar businesses to return"),
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
 ):
     """Find businesses similar to the specified business"""
     try:
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
         similar_results = await service.get_similar_businesses(business_name, limit)
         
-        return [
+        return _JSONResponse([
             {
-                "business": result.business.dict(),
+                "business": result.business.json_dict,
                 "similarity_score": result.score,
                 "certainty": result.certainty,
                 "distance": result.distance,
                 "confidence": result.confidence
             }
             for result in similar_results
-        ]
+        ])
         
     except Exception as e:
-        logger.error(f"Similarity search failed: {e}")
+        logger.error("Similarity search failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Similarity search failed: {str(e)}"
         )
 
 
-@router.get("/search/quick", response_model=Dict[str, Any])
+# Fixed /search/quick projection, read from each result in one C-level call
+_QUICK_KEYS = (
+    "business_name", "business_type", "neighborhood",
+    "founding_year", "heritage_score", "confidence",
+)
+_quick_fields = attrgetter(
+    "business.business_name", "business.business_type", "business.neighborhood",
+    "business.founding_year", "business.heritage_score", "confidence",
+)
+
+
+@router.get("/search/quick", response_class=_JSONResponse)
 async def quick_search(
     q: str = Query(..., description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results to return"),
     neighborhood: Optional[str] = Query(None, description="Filter by neighborhood"),
     business_type: Optional[str] = Query(None, description="Filter by business type"),
-    min_heritage_score: Optional[int] = Query(None, ge=0, le=100, description="Minimum heritage score")
+    min_heritage_score: Optional[int] = Query(None, ge=0, le=100, description="Minimum heritage score"),
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
 ):
     """
     Quick search endpoint with URL parameters.
     Convenient for simple searches without POST body.
     """
     try:
+        filters = (limit, neighborhood, business_type, min_heritage_score)
+        cached = _quick_search_cache.lookup(q, filters)
+        if cached is not None:
+            return _JSONResponse({**cached, "query": q})
+        
         # Build search request from query parameters
         search_request = LegacyBusinessSearch(
             query=q,
@@ -246,65 +419,42 @@ async def quick_search(
             heritage_score_min=min_heritage_score
         )
         
-        service = get_weaviate_service()
+        async def fetch():
+            search_response = await service.search_businesses(search_request)
+            
+            payload = {
+                "results": [
+                    dict(zip(_QUICK_KEYS, _quick_fields(result)))
+                    for result in search_response.results
+                ],
+                "query": search_response.query,
+                "total_count": search_response.total_count,
+                "execution_time_ms": search_response.execution_time_ms,
+                "used_fallback": search_response.used_fallback
+            }
+            _quick_search_cache.store(q, filters, payload)
+            return payload
         
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
-        search_response = await service.search_businesses(search_request)
-        
-        return {
-            "results": [
-                {
-                    "business_name": result.business.business_name,
-                    "business_type": result.business.business_type,
-                    "neighborhood": result.business.neighborhood,
-                    "founding_year": result.business.founding_year,
-                    "heritage_score": result.business.heritage_score,
-                    "confidence": result.confidence
-                }
-                for result in search_response.results
-            ],
-            "query": search_response.query,
-            "total_count": search_response.total_count,
-            "execution_time_ms": search_response.execution_time_ms,
-            "used_fallback": search_response.used_fallback
-        }
+        payload = await _quick_search_flights.do(_quick_search_cache.key(q, filters), fetch)
+        return _JSONResponse(payload if payload["query"] == q else {**payload, "query": q})
         
     except Exception as e:
-        logger.error(f"Quick search failed: {e}")
+        logger.error("Quick search failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Quick search failed: {str(e)}"
         )
 
 
-@router.get("/collections/info", response_model=Dict[str, Any])
-async def get_collection_info():
+@router.get("/collections/info", response_class=_JSONResponse)
+async def get_collection_info(
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
     """Get information about the Weaviate collection"""
     try:
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
-        status = await service.get_service_status()
+        status = await _cached_snapshot("status", service.get_service_status)
         
-        return {
+        return _JSONResponse({
             "collection_name": status.get("collection_name", "LegacyBusiness"),
             "total_objects": status.get("total_objects", 0),
             "vectorizer": status.get("vectorizer", "unknown"),
@@ -312,11 +462,11 @@ async def get_collection_info():
             "features": status.get("features", {}),
             "last_updated": status.get("last_updated"),
             "schema_version": "1.0",
-            "supported_search_modes": [mode.value for mode in SearchMode]
-        }
+            "supported_search_modes": _SUPPORTED_SEARCH_MODES
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get collection info: {e}")
+        logger.error("Failed to get collection info: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve collection info: {str(e)}"
@@ -324,8 +474,11 @@ async def get_collection_info():
 
 
 # RAG Query Agent Endpoints (Stubs for future implementation)
-@router.post("/agent/question", response_model=Dict[str, Any])
-async def ask_question(request: Dict[str, Any]):
+@router.post("/agent/question", response_class=_JSONResponse)
+async def ask_question(
+    request: Dict[str, Any],
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
     """
     Ask a question about legacy businesses using RAG.
     
@@ -335,44 +488,44 @@ async def ask_question(request: Dict[str, Any]):
     - Multi-step reasoning
     - Follow-up question suggestions
     """
+    question = request.get("question")
+    if not question:
+        raise HTTPException(status_code=400, detail=_QUESTION_REQUIRED)
+    
     try:
-        question = request.get("question")
-        if not question:
-            raise HTTPException(
-                status_code=400,
-                detail="Question is required"
+        context_limit = request.get("context_limit", 5)
+        cached = _question_cache.lookup(question, context_limit)
+        if cached is not None:
+            return _JSONResponse({**cached, "question": question})
+        
+        async def answer():
+            agent = get_query_agent(service)
+            response = await agent.answer_question(
+                question=question,
+                context_limit=context_limit
             )
+            
+            _question_cache.store(question, context_limit, response)
+            return response
         
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
-        agent = WeaviateQueryAgent(service)
-        response = await agent.answer_question(
-            question=question,
-            context_limit=request.get("context_limit", 5)
+        response = await _question_flights.do(_question_cache.key(question, context_limit), answer)
+        return _JSONResponse(
+            response if response["question"] == question else {**response, "question": question}
         )
         
-        return response
-        
     except Exception as e:
-        logger.error(f"Question answering failed: {e}")
+        logger.error("Question answering failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Question answering failed: {str(e)}"
         )
 
 
-@router.post("/agent/recommend", response_model=List[Dict[str, Any]])
-async def recommend_businesses(request: Dict[str, Any]):
+@router.post("/agent/recommend", response_class=_JSONResponse)
+async def recommend_businesses(
+    request: Dict[str, Any],
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
+):
     """
     Get business recommendations based on user criteria.
     
@@ -386,37 +539,26 @@ async def recommend_businesses(request: Dict[str, Any]):
         criteria = request.get("criteria", {})
         limit = request.get("limit", 3)
         
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
-        agent = WeaviateQueryAgent(service)
+        agent = get_query_agent(service)
         recommendations = await agent.recommend_businesses(
             criteria=criteria,
             limit=limit
         )
         
-        return recommendations
+        return _JSONResponse(recommendations)
         
     except Exception as e:
-        logger.error(f"Recommendation failed: {e}")
+        logger.error("Recommendation failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Recommendation failed: {str(e)}"
         )
 
 
-@router.get("/agent/trends", response_model=Dict[str, Any])
+@router.get("/agent/trends", response_class=_JSONResponse)
 async def analyze_trends(
-    timeframe: str = Query("decade", description="Analysis timeframe (decade, year, century)")
+    timeframe: str = Query("decade", description="Analysis timeframe (decade, year, century)"),
+    service: Union[WeaviateService, MockWeaviateService] = Depends(get_connected_service)
 ):
     """
     Analyze historical trends in legacy business data.
@@ -428,25 +570,13 @@ async def analyze_trends(
     - Cultural impact assessment
     """
     try:
-        service = get_weaviate_service()
-        
-        # For live service, ensure connection
-        if isinstance(service, WeaviateService):
-            if not service.is_connected:
-                connected = await service.connect()
-                if not connected:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="Cannot connect to Weaviate service"
-                    )
-        
-        agent = WeaviateQueryAgent(service)
+        agent = get_query_agent(service)
         analysis = await agent.analyze_trends(timeframe=timeframe)
         
-        return analysis
+        return _JSONResponse(analysis)
         
     except Exception as e:
-        logger.error(f"Trend analysis failed: {e}")
+        logger.error("Trend analysis failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Trend analysis failed: {str(e)}"
@@ -454,7 +584,7 @@ async def analyze_trends(
 
 
 # Migration and Management Endpoints
-@router.post("/migrate/check", response_model=Dict[str, Any])
+@router.post("/migrate/check", response_class=_JSONResponse)
 async def check_migration_status():
     """
     Check if Weaviate schema migration is needed.
@@ -468,27 +598,27 @@ async def check_migration_status():
         service = get_weaviate_service()
         
         if isinstance(service, MockWeaviateService):
-            return {
+            return _JSONResponse({
                 "migration_needed": False,
                 "current_version": "mock",
                 "target_version": "mock",
                 "status": "mock_mode",
                 "message": "Running in mock mode - no migration needed"
-            }
+            })
         
         # For live service, check connection and schema
-        if not service.is_connected:
-            connected = await service.connect()
-            if not connected:
-                return {
-                    "migration_needed": True,
-                    "status": "connection_failed",
-                    "message": "Cannot connect to Weaviate - check configuration"
-                }
+        try:
+            await service.ensure_connected()
+        except ConnectionError:
+            return _JSONResponse({
+                "migration_needed": True,
+                "status": "connection_failed",
+                "message": "Cannot connect to Weaviate - check configuration"
+            })
         
         status = await service.get_service_status()
         
-        return {
+        return _JSONResponse({
             "migration_needed": False,  # Assume schema exists for now
             "current_version": "1.0",
             "target_version": "1.0", 
@@ -499,19 +629,58 @@ async def check_migration_status():
                 "vectorizer": status.get("vectorizer")
             },
             "message": "Schema is up to date"
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Migration check failed: {e}")
-        return {
+        logger.error("Migration check failed: %s", e)
+        return _JSONResponse({
             "migration_needed": True,
             "status": "error",
             "error": str(e),
             "message": "Migration check failed - manual intervention may be required"
-        }
+        })
+
 
+# Static portions of /demo/sample-data and /collections/info, built once
+_SUPPORTED_SEARCH_MODES = tuple(mode.value for mode in SearchMode)
 
-@router.get("/demo/sample-data", response_model=Dict[str, Any])
+_SAMPLE_DATA_STRUCTURE = {
+    "description": "Each business contains rich narrative content optimized for semantic search",
+    "key_fields": [
+        "business_name",
+        "founding_story", 
+        "cultural_significance",
+        "unique_features",
+        "demo_highlights"
+    ],
+    "search_optimized": [
+        "founding_story",
+        "cultural_significance", 
+        "community_impact",
+        "historical_significance"
+    ]
+}
+
+_SAMPLE_SEARCH_EXAMPLES = (
+    {
+        "query": "traditional Chinese cooking",
+        "expected_matches": ["The Wok Shop"],
+        "reason": "Matches founding story and cultural significance"
+    },
+    {
+        "query": "family business heritage",
+        "expected_matches": ["Swan Oyster Depot"],
+        "reason": "Multi-generational family ownership"
+    },
+    {
+        "query": "literary culture bookstore",
+        "expected_matches": ["City Lights Bookstore", "Green Apple Books"],
+        "reason": "Literary significance and community role"
+    }
+)
+
+
+@router.get("/demo/sample-data", response_class=_JSONResponse)
 async def get_sample_data():
     """
     Get sample data for demo purposes.
@@ -520,48 +689,19 @@ async def get_sample_data():
     try:
         service = get_weaviate_service()
         
-        # Get a few sample businesses
-        businesses = await service.list_all_businesses(limit=3)
-        
-        return {
-            "sample_businesses": [business.dict() for business in businesses],
-            "data_structure": {
-                "description": "Each business contains rich narrative content optimized for semantic search",
-                "key_fields": [
-                    "business_name",
-                    "founding_story", 
-                    "cultural_significance",
-                    "unique_features",
-                    "demo_highlights"
-                ],
-                "search_optimized": [
-                    "founding_story",
-                    "cultural_significance", 
-                    "community_impact",
-                    "historical_significance"
-                ]
-            },
-            "search_examples": [
-                {
-                    "query": "traditional Chinese cooking",
-                    "expected_matches": ["The Wok Shop"],
-                    "reason": "Matches founding story and cultural significance"
-                },
-                {
-                    "query": "family business heritage",
-                    "expected_matches": ["Swan Oyster Depot"],
-                    "reason": "Multi-generational family ownership"
-                },
-                {
-                    "query": "literary culture bookstore",
-                    "expected_matches": ["City Lights Bookstore", "Green Apple Books"],
-                    "reason": "Literary significance and community role"
-                }
-            ]
-        }
+        async def fetch_samples():
+            # Get a few sample businesses
+            businesses = await service.list_all_businesses(limit=3)
+            return [business.json_dict for business in businesses]
+        
+        return _JSONResponse({
+            "sample_businesses": await _cached_snapshot("sample_businesses", fetch_samples),
+            "data_structure": _SAMPLE_DATA_STRUCTURE,
+            "search_examples": _SAMPLE_SEARCH_EXAMPLES
+        })
         
     except Exception as e:
-        logger.error(f"Sample data retrieval failed: {e}")
+        logger.error("Sample data retrieval failed: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve sample data: {str(e)}"
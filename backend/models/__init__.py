@@ -6,14 +6,17 @@ Pydantic models for the SF Legacy Business Registry RAG system.
 """
 
 from .legacy_business import *
+from .legacy_business import LegacyBusinessMutable, VectorizeHint
 
 __all__ = [
     'LegacyBusiness',
+    'LegacyBusinessMutable',
     'LegacyBusinessSummary', 
     'LegacyBusinessSearch',
     'LocationHistory',
     'Recognition',
     'NeighborhoodEnum',
     'ComponentTypeEnum',
-    'RAGWeightEnum'
+    'RAGWeightEnum',
+    'VectorizeHint'
 ]
\ No newline at end of file
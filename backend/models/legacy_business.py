@@ -9,10 +9,15 @@ Production-ready data models designed for:
 - Type-safe API responses
 """
 
-from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator, root_validator
+from functools import cached_property
+from typing import Annotated, List, Literal, Optional, Dict, Any, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationInfo, field_validator, model_validator
 from datetime import datetime
 from enum import Enum
+import os
+import re
+import sys
+import time
 
 class NeighborhoodEnum(str, Enum):
     """SF neighborhoods with legacy business concentrations"""
@@ -46,6 +51,12 @@ class RAGWeightEnum(str, Enum):
     MEDIUM = "medium"  # Supporting fields (physical_traditions, recognition)
     LOW = "low"        # Metadata fields (addresses, contact info)
 
+class VectorizeHint(str, Enum):
+    """How a field is stored in the Weaviate collection (fields without one aren't stored)"""
+    PRIMARY = "primary"  # Vectorized content, embedded without its property name
+    INCLUDE = "include"  # Vectorized alongside the primary content
+    SKIP = "skip"        # Stored for filtering and display, not vectorized
+
 class BusinessStatusEnum(str, Enum):
     """Current operational status"""
     ACTIVE = "active"
@@ -53,16 +64,56 @@ class BusinessStatusEnum(str, Enum):
     RELOCATED = "relocated"
     PENDING_REVIEW = "pending_review"
 
+# Request/response examples only feed the OpenAPI docs. They are attached
+# through json_schema_extra callables, so the dicts are built only when a
+# schema is generated; OPENAPI_EXAMPLES=0 leaves them out entirely for
+# workers that never serve /docs
+OPENAPI_EXAMPLES = os.getenv("OPENAPI_EXAMPLES", "1").lower() not in ("0", "false", "no")
+
+def _recognition_example(schema: Dict[str, Any]) -> None:
+    schema["example"] = {
+        "title": "Featured on PBS Cooking Show",
+        "year": 2019,
+        "issuer": "Public Broadcasting Service",
+        "description": "International cooking demonstration",
+        "media_type": "television"
+    }
+
+def _legacy_business_example(schema: Dict[str, Any]) -> None:
+    schema["example"] = {
+        "business_name": "The Wok Shop",
+        "founding_year": 1972,
+        "current_address": "718 Grant Avenue",
+        "neighborhood": "Chinatown",
+        "business_type": "Kitchen Supply Store",
+        "founding_story": "Founded after Nixon's 1972 China trip when Americans became interested in authentic Chinese cooking. Started by importing traditional woks and cooking equipment directly from China.",
+        "cultural_significance": "Serves as cultural ambassador teaching wok cooking to international audience. Bridge between traditional Chinese cooking techniques and American home kitchens.",
+        "unique_features": ["Original 1970s pagoda neon sign", "Woks hanging from ceiling like roasted ducks", "International shipping to cooking enthusiasts worldwide"],
+        "demo_highlights": ["Featured on PBS cooking shows", "International customer base", "50+ years serving SF Chinatown"]
+    }
+
+# Model fields validate against Literals of the enum values: a string
+# match rather than building an enum member per value. The enums remain
+# for display code and field metadata.
+Neighborhood = Literal[tuple(n.value for n in NeighborhoodEnum)]
+BusinessStatus = Literal[tuple(s.value for s in BusinessStatusEnum)]
+
+# Shared constrained types; each bound is declared once and reused
+Year = Annotated[int, Field(ge=1850, le=2024)]
+Score = Annotated[int, Field(ge=0, le=100)]
+Confidence = Annotated[float, Field(ge=0.0, le=1.0)]
+
 class LocationHistory(BaseModel):
     """Historical address information"""
     address: str = Field(..., description="Full street address")
-    start_year: int = Field(..., ge=1850, le=2024, description="Year business moved to this location")
-    end_year: Optional[int] = Field(None, ge=1850, le=2024, description="Year business left this location")
+    start_year: Year = Field(..., description="Year business moved to this location")
+    end_year: Optional[Year] = Field(None, description="Year business left this location")
     is_current: bool = Field(default=True, description="Is this the current location")
     
-    @validator('end_year')
-    def end_after_start(cls, v, values):
-        if v and 'start_year' in values and v < values['start_year']:
+    @field_validator('end_year')
+    @classmethod
+    def end_after_start(cls, v, info: ValidationInfo):
+        if v and 'start_year' in info.data and v < info.data['start_year']:
             raise ValueError('End year must be after start year')
         return v
     
@@ -76,27 +127,20 @@ class LocationHistory(BaseModel):
 class Recognition(BaseModel):
     """Awards, media coverage, and formal recognition"""
     title: str = Field(..., description="Award or recognition name")
-    year: Optional[int] = Field(None, ge=1850, le=2024, description="Year received")
+    year: Optional[Year] = Field(None, description="Year received")
     issuer: str = Field(..., description="Organization that granted recognition")
     description: Optional[str] = Field(None, description="Additional details")
     media_type: Optional[str] = Field(None, description="Type of media coverage")
     
-    class Config:
-        schema_extra = {
-            "example": {
-                "title": "Featured on PBS Cooking Show",
-                "year": 2019,
-                "issuer": "Public Broadcasting Service",
-                "description": "International cooking demonstration",
-                "media_type": "television"
-            }
-        }
+    model_config = ConfigDict(
+        json_schema_extra=_recognition_example if OPENAPI_EXAMPLES else None
+    )
 
 class OwnershipHistory(BaseModel):
     """Business ownership and succession information"""
     owner_name: str = Field(..., description="Owner or family name")
-    start_year: Optional[int] = Field(None, ge=1850, le=2024)
-    end_year: Optional[int] = Field(None, ge=1850, le=2024)
+    start_year: Optional[Year] = None
+    end_year: Optional[Year] = None
     relationship: Optional[str] = Field(None, description="Relationship to previous owner")
     generation: Optional[int] = Field(None, ge=1, le=10, description="Generation number for family businesses")
 
@@ -116,33 +160,35 @@ class LegacyBusiness(BaseModel):
         pdf_extraction_hints=["Business Name:", "THE WOK SHOP", "Application No.:", "business name"],
         frontend_component=ComponentTypeEnum.TEXT,
         rag_weight=RAGWeightEnum.HIGH,
-        search_boost=2.0
+        search_boost=2.0,
+        vectorize=VectorizeHint.PRIMARY
     )
     
     legal_name: Optional[str] = Field(
         None,
         title="Legal Business Name", 
         description="Legal entity name if different from DBA",
-        pdf_extraction_hints=["legal name", "LLC", "Corporation", "incorporated"]
+        pdf_extraction_hints=["legal name", "LLC", "Corporation", "incorporated"],
+        vectorize=VectorizeHint.SKIP
     )
     
     dba_name: Optional[str] = Field(
         None,
         title="DBA Name",
         description="Doing Business As name",
-        pdf_extraction_hints=["DBA", "doing business as", "trade name"]
+        pdf_extraction_hints=["DBA", "doing business as", "trade name"],
+        vectorize=VectorizeHint.SKIP
     )
     
     # === TEMPORAL DATA ===
-    founding_year: Optional[int] = Field(
+    founding_year: Optional[Year] = Field(
         None,
         title="Year Founded",
         description="Year the business was originally established",
         pdf_extraction_hints=["founded", "established", "opened", "START DATE", "since"],
         frontend_component=ComponentTypeEnum.NUMBER,
-        ge=1850,
-        le=2024,
-        rag_weight=RAGWeightEnum.MEDIUM
+        rag_weight=RAGWeightEnum.MEDIUM,
+        vectorize=VectorizeHint.SKIP
     )
     
     years_at_current_location: Optional[int] = Field(
@@ -151,7 +197,8 @@ class LegacyBusiness(BaseModel):
         description="How long at the current address",
         pdf_extraction_hints=["current location", "moved to", "years at"],
         ge=0,
-        le=200
+        le=200,
+        vectorize=VectorizeHint.SKIP
     )
     
     # === LOCATION DATA ===
@@ -161,16 +208,18 @@ class LegacyBusiness(BaseModel):
         description="Primary business location street address",
         pdf_extraction_hints=["Business Address:", "located at", "Grant Avenue", "address"],
         frontend_component=ComponentTypeEnum.TEXT,
-        rag_weight=RAGWeightEnum.LOW
+        rag_weight=RAGWeightEnum.LOW,
+        vectorize=VectorizeHint.SKIP
     )
     
-    neighborhood: Optional[NeighborhoodEnum] = Field(
+    neighborhood: Optional[Neighborhood] = Field(
         None,
         title="Neighborhood",
         description="San Francisco neighborhood or district",
         pdf_extraction_hints=["District", "neighborhood", "Chinatown", "Mission", "Castro"],
         frontend_component=ComponentTypeEnum.SELECT,
-        rag_weight=RAGWeightEnum.MEDIUM
+        rag_weight=RAGWeightEnum.MEDIUM,
+        vectorize=VectorizeHint.INCLUDE
     )
     
     location_history: List[LocationHistory] = Field(
@@ -189,14 +238,16 @@ class LegacyBusiness(BaseModel):
         pdf_extraction_hints=["business type", "category", "restaurant", "bookstore", "BUSINESS DESCRIPTION"],
         frontend_component=ComponentTypeEnum.TEXT,
         rag_weight=RAGWeightEnum.MEDIUM,
-        examples=["Kitchen Supply Store", "Family Restaurant", "Independent Bookstore", "Traditional Bakery"]
+        examples=["Kitchen Supply Store", "Family Restaurant", "Independent Bookstore", "Traditional Bakery"],
+        vectorize=VectorizeHint.INCLUDE
     )
     
     business_category: Optional[str] = Field(
         None,
         title="Legacy Business Category",
         description="Official legacy business registry category",
-        pdf_extraction_hints=["category", "classification", "sector"]
+        pdf_extraction_hints=["category", "classification", "sector"],
+        vectorize=VectorizeHint.INCLUDE
     )
     
     # === RICH NARRATIVE CONTENT (High RAG value) ===
@@ -207,7 +258,8 @@ class LegacyBusiness(BaseModel):
         pdf_extraction_hints=["CRITERION 1", "founded by", "history", "started", "began"],
         frontend_component=ComponentTypeEnum.TEXTAREA,
         rag_weight=RAGWeightEnum.HIGH,
-        search_boost=1.8
+        search_boost=1.8,
+        vectorize=VectorizeHint.PRIMARY
     )
     
     cultural_significance: Optional[str] = Field(
@@ -217,7 +269,8 @@ class LegacyBusiness(BaseModel):
         pdf_extraction_hints=["CRITERION 2", "cultural", "community", "tradition", "heritage"],
         frontend_component=ComponentTypeEnum.TEXTAREA,
         rag_weight=RAGWeightEnum.HIGH,
-        search_boost=1.8
+        search_boost=1.8,
+        vectorize=VectorizeHint.PRIMARY
     )
     
     physical_traditions: Optional[str] = Field(
@@ -226,7 +279,8 @@ class LegacyBusiness(BaseModel):
         description="Unique physical characteristics and traditional practices",
         pdf_extraction_hints=["CRITERION 3", "physical features", "traditions", "decor", "atmosphere"],
         frontend_component=ComponentTypeEnum.TEXTAREA,
-        rag_weight=RAGWeightEnum.MEDIUM
+        rag_weight=RAGWeightEnum.MEDIUM,
+        vectorize=VectorizeHint.INCLUDE
     )
     
     community_impact: Optional[str] = Field(
@@ -235,7 +289,8 @@ class LegacyBusiness(BaseModel):
         description="Documented community benefits and social contributions",
         pdf_extraction_hints=["community benefit", "serves", "impact", "contributes"],
         frontend_component=ComponentTypeEnum.TEXTAREA,
-        rag_weight=RAGWeightEnum.HIGH
+        rag_weight=RAGWeightEnum.HIGH,
+        vectorize=VectorizeHint.INCLUDE
     )
     
     historical_significance: Optional[str] = Field(
@@ -244,7 +299,8 @@ class LegacyBusiness(BaseModel):
         description="Role in historical events or periods",
         pdf_extraction_hints=["historical", "earthquake", "war", "survived", "witnessed"],
         frontend_component=ComponentTypeEnum.TEXTAREA,
-        rag_weight=RAGWeightEnum.HIGH
+        rag_weight=RAGWeightEnum.HIGH,
+        vectorize=VectorizeHint.INCLUDE
     )
     
     # === STRUCTURED RELATIONSHIP DATA ===
@@ -265,54 +321,60 @@ class LegacyBusiness(BaseModel):
     )
     
     # === DISTINCTIVE FEATURES ===
-    unique_features: List[str] = Field(
-        default_factory=list,
+    unique_features: Tuple[str, ...] = Field(
+        default=(),
         title="Unique Features",
         description="What makes this business distinctive and memorable",
         pdf_extraction_hints=["unique", "special", "original", "distinctive", "notable"],
         frontend_component=ComponentTypeEnum.TAGS,
         rag_weight=RAGWeightEnum.MEDIUM,
-        examples=["Original 1970s neon sign", "Woks hanging from ceiling", "Hand-painted murals"]
+        examples=["Original 1970s neon sign", "Woks hanging from ceiling", "Hand-painted murals"],
+        vectorize=VectorizeHint.INCLUDE
     )
     
-    signature_products: List[str] = Field(
-        default_factory=list,
+    signature_products: Tuple[str, ...] = Field(
+        default=(),
         title="Signature Products/Services",
         description="Flagship offerings that define the business",
         pdf_extraction_hints=["specialty", "famous for", "signature", "known for"],
-        frontend_component=ComponentTypeEnum.TAGS
+        frontend_component=ComponentTypeEnum.TAGS,
+        vectorize=VectorizeHint.INCLUDE
     )
     
     # === SEARCH & DISCOVERY ===
-    search_tags: List[str] = Field(
-        default_factory=list,
+    search_tags: Tuple[str, ...] = Field(
+        default=(),
         title="Search Tags",
         description="Auto-generated and manual tags for enhanced discoverability",
         auto_generate=True,
-        examples=["family-owned", "third-generation", "celebrity-featured", "earthquake-survivor"]
+        examples=["family-owned", "third-generation", "celebrity-featured", "earthquake-survivor"],
+        vectorize=VectorizeHint.INCLUDE
     )
     
-    demo_highlights: List[str] = Field(
-        default_factory=list,
+    demo_highlights: Tuple[str, ...] = Field(
+        default=(),
         title="Demo Talking Points",
         description="Key points for presentations, tours, and media",
         pdf_extraction_hints=["featured on", "internationally known", "famous", "celebrity"],
         frontend_component=ComponentTypeEnum.TAGS,
         max_items=5,
-        rag_weight=RAGWeightEnum.MEDIUM
+        rag_weight=RAGWeightEnum.MEDIUM,
+        vectorize=VectorizeHint.INCLUDE
     )
     
     # === OPERATIONAL STATUS ===
-    current_status: BusinessStatusEnum = Field(
-        default=BusinessStatusEnum.ACTIVE,
+    current_status: BusinessStatus = Field(
+        default=BusinessStatusEnum.ACTIVE.value,
         title="Current Status",
-        description="Current operational status"
+        description="Current operational status",
+        vectorize=VectorizeHint.SKIP
     )
     
     status_notes: Optional[str] = Field(
         None,
         title="Status Notes",
-        description="Additional information about current status"
+        description="Additional information about current status",
+        vectorize=VectorizeHint.SKIP
     )
     
     # === APPLICATION METADATA ===
@@ -321,116 +383,213 @@ class LegacyBusiness(BaseModel):
         title="Application ID",
         description="Legacy Business Registry application number",
         pdf_extraction_hints=["Application No.:", "LBR-", "Case No.:", "application"],
-        example="LBR-2016-17-064"
+        example="LBR-2016-17-064",
+        vectorize=VectorizeHint.SKIP
     )
     
-    heritage_score: Optional[int] = Field(
+    heritage_score: Optional[Score] = Field(
         None,
         title="Heritage Score",
         description="Calculated heritage significance score",
-        ge=0,
-        le=100
+        vectorize=VectorizeHint.SKIP
     )
     
     # === TEMPORAL METADATA ===
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: Optional[datetime] = None
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        description="Record creation timestamp",
+        vectorize=VectorizeHint.SKIP
+    )
+    updated_at: Optional[datetime] = Field(
+        None,
+        description="Last update timestamp",
+        vectorize=VectorizeHint.SKIP
+    )
     last_verified: Optional[datetime] = Field(
         None,
-        description="When the information was last verified"
+        description="When the information was last verified",
+        vectorize=VectorizeHint.SKIP
     )
     
     # === SOURCE TRACKING ===
-    source_documents: List[str] = Field(
-        default_factory=list,
+    source_documents: Tuple[str, ...] = Field(
+        default=(),
         title="Source Documents",
         description="List of source PDFs and documents used for extraction"
     )
     
-    extraction_confidence: Optional[float] = Field(
+    extraction_confidence: Optional[Confidence] = Field(
         None,
         title="Extraction Confidence",
         description="Confidence score for automated extraction",
-        ge=0.0,
-        le=1.0
-    )
-    
-    class Config:
-        use_enum_values = True
-        validate_assignment = True
-        json_schema_extra = {
-            "example": {
-                "business_name": "The Wok Shop",
-                "founding_year": 1972,
-                "current_address": "718 Grant Avenue",
-                "neighborhood": "Chinatown",
-                "business_type": "Kitchen Supply Store",
-                "founding_story": "Founded after Nixon's 1972 China trip when Americans became interested in authentic Chinese cooking. Started by importing traditional woks and cooking equipment directly from China.",
-                "cultural_significance": "Serves as cultural ambassador teaching wok cooking to international audience. Bridge between traditional Chinese cooking techniques and American home kitchens.",
-                "unique_features": ["Original 1970s pagoda neon sign", "Woks hanging from ceiling like roasted ducks", "International shipping to cooking enthusiasts worldwide"],
-                "demo_highlights": ["Featured on PBS cooking shows", "International customer base", "50+ years serving SF Chinatown"]
-            }
-        }
-    
-    @root_validator(pre=False, skip_on_failure=True)
-    def validate_business_data(cls, values):
-        """Cross-field validation and data consistency checks"""
-        
-        # Ensure current location consistency
-        current_address = values.get('current_address')
-        location_history = values.get('location_history', [])
-        
-        if current_address and location_history:
-            current_locations = [loc for loc in location_history if loc.is_current]
-            if current_locations and current_locations[0].address != current_address:
-                # Auto-sync current address with location history
-                values['current_address'] = current_locations[0].address
-        
-        return values
+        vectorize=VectorizeHint.SKIP
+    )
+    
+    model_config = ConfigDict(
+        use_enum_values=True,
+        validate_assignment=True,
+        json_schema_extra=_legacy_business_example if OPENAPI_EXAMPLES else None
+    )
     
-    @validator('search_tags', pre=True, always=True)
-    def generate_search_tags(cls, v, values):
-        """Auto-generate search tags based on other fields"""
-        tags = set(v) if v else set()
+    @classmethod
+    def from_untrusted(cls, data: Dict[str, Any]) -> "LegacyBusiness":
+        """Validate external input (PDF extraction, API payloads)"""
+        return cls.model_validate(data)
+    
+    @classmethod
+    def bulk_construct(cls, rows: List[Dict[str, Any]]) -> List["LegacyBusiness"]:
+        """
+        Build many already-validated records (stored rows, re-imports) at once.
         
-        # Add temporal tags
-        founding_year = values.get('founding_year')
-        if founding_year:
-            if founding_year < 1900:
-                tags.add("19th-century")
-            elif founding_year < 1950:
-                tags.add("early-20th-century")
-            else:
-                tags.add("mid-century")
+        Rows are constructed without validation after the cheap JSON-to-model
+        coercions: ISO timestamp strings are parsed and string lists become
+        interned tuples. The address sync from validate_business_data is then
+        applied in one sweep; stored search_tags are kept and only generated
+        for rows that have none. Suspect rows -- a required field missing,
+        nested entries still plain dicts, or an unparseable timestamp -- go
+        through model_validate instead.
+        """
+        businesses = []
+        for row in rows:
+            values = _coerce_stored_row(row)
+            if values is None or not _REQUIRED_FIELDS.issubset(values) or any(
+                isinstance(entry, dict)
+                for name in _NESTED_FIELDS
+                for entry in values.get(name) or ()
+            ):
+                businesses.append(cls.model_validate(row))
+                continue
             
-            # Age-based tags
-            current_year = datetime.now().year
-            age = current_year - founding_year
-            if age > 100:
-                tags.add("century-old")
-            elif age > 75:
-                tags.add("historic")
-            elif age > 50:
-                tags.add("established")
-        
-        # Add content-based tags
-        founding_story = values.get('founding_story', '').lower()
-        if 'family' in founding_story:
-            tags.add("family-owned")
-        if 'immigrant' in founding_story:
-            tags.add("immigrant-founded")
+            business = cls.model_construct(**values)
+            values = business.__dict__
+            current = next((loc for loc in business.location_history if loc.is_current), None)
+            if current is not None and business.current_address and current.address != business.current_address:
+                values['current_address'] = current.address
+            if not business.search_tags:
+                values['search_tags'] = compute_search_tags(business)
+            businesses.append(business)
+        return businesses
+    
+    @field_validator(
+        'unique_features', 'signature_products', 'search_tags',
+        'demo_highlights', 'source_documents'
+    )
+    @classmethod
+    def intern_strings(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        """Intern entries so repeated tags across records share one str"""
+        return _intern_all(v)
+    
+    @cached_property
+    def tag_set(self) -> frozenset:
+        """search_tags as a frozenset for filter checks, built once per instance"""
+        return frozenset(self.search_tags)
+    
+    @model_validator(mode='after')
+    def validate_business_data(self):
+        """Cross-field validation and data consistency checks"""
+        # Writes go through __dict__: validate_assignment would otherwise
+        # re-enter this validator
         
-        # Recognition-based tags
-        recognition = values.get('recognition', [])
-        if recognition:
-            tags.add("award-winning")
-            
-        # Neighborhood heritage tags
-        neighborhood = values.get('neighborhood')
-        if neighborhood:
-            tags.add(f"{neighborhood.lower().replace(' ', '-')}-heritage")
+        # Ensure current location consistency
+        if self.current_address and self.location_history:
+            current_locations = [loc for loc in self.location_history if loc.is_current]
+            if current_locations and current_locations[0].address != self.current_address:
+                # Auto-sync current address with location history
+                self.__dict__['current_address'] = current_locations[0].address
         
-        return list(tags)
+        self.__dict__['search_tags'] = compute_search_tags(self)
+        # Drop any tag_set cached before this (re)validation
+        self.__dict__.pop('tag_set', None)
+        return self
+
+def _intern_all(values: Tuple[str, ...]) -> Tuple[str, ...]:
+    return tuple(sys.intern(value) for value in values)
+
+# Tag lookup tables for compute_search_tags, built once at import
+_NEIGHBORHOOD_TAGS = {
+    n.value: f"{n.value.lower().replace(' ', '-')}-heritage" for n in NeighborhoodEnum
+}
+# (founding year upper bound, tag), first match wins
+_ERA_BUCKETS = ((1900, "19th-century"), (1950, "early-20th-century"), (10**9, "mid-century"))
+# (minimum age exclusive, tag), first match wins
+_AGE_BUCKETS = ((100, "century-old"), (75, "historic"), (50, "established"))
+
+# Founding-story keywords (substring match, as before) and their tags
+_STORY_TAGS = {"family": "family-owned", "immigrant": "immigrant-founded"}
+_STORY_KEYWORD_RE = re.compile("|".join(_STORY_TAGS), re.IGNORECASE)
+
+# Generated tags that describe one value of a field (era, age bracket,
+# neighborhood). They are re-derived on every recompute rather than carried
+# over, so changing founding_year or neighborhood replaces them instead of
+# leaving contradictory tags behind; other given tags are kept.
+_FIELD_DERIVED_TAGS = frozenset(
+    [tag for _, tag in _ERA_BUCKETS]
+    + [tag for _, tag in _AGE_BUCKETS]
+    + list(_NEIGHBORHOOD_TAGS.values())
+)
+
+# Current year, re-read at most hourly rather than per model
+_YEAR_CACHE = [0, 0.0]
+
+def _current_year() -> int:
+    now = time.monotonic()
+    if now >= _YEAR_CACHE[1]:
+        _YEAR_CACHE[0] = datetime.now().year
+        _YEAR_CACHE[1] = now + 3600
+    return _YEAR_CACHE[0]
+
+# Generated tags as interned frozensets, keyed by the tuple of tags that
+# apply (None where a rule doesn't fire); bounded so unusual neighborhood
+# strings can't grow it without limit
+_TAG_FRAGMENTS: Dict[tuple, frozenset] = {}
+_TAG_FRAGMENTS_MAX = 4096
+
+def _tag_fragment(key: tuple) -> frozenset:
+    fragment = _TAG_FRAGMENTS.get(key)
+    if fragment is None:
+        fragment = frozenset(sys.intern(tag) for tag in key if tag)
+        if len(_TAG_FRAGMENTS) < _TAG_FRAGMENTS_MAX:
+            _TAG_FRAGMENTS[key] = fragment
+    return fragment
+
+def compute_search_tags(business: LegacyBusiness) -> Tuple[str, ...]:
+    """Auto-generate search tags based on other fields, keeping other given tags"""
+    # Temporal tags
+    era_tag = age_tag = None
+    founding_year = business.founding_year
+    if founding_year:
+        era_tag = next(tag for cutoff, tag in _ERA_BUCKETS if founding_year < cutoff)
+        age = _current_year() - founding_year
+        age_tag = next((tag for floor, tag in _AGE_BUCKETS if age > floor), None)
+    
+    # Content-based tags, from one case-insensitive pass over the story
+    family_tag = immigrant_tag = None
+    if business.founding_story:
+        hits = {m.lower() for m in _STORY_KEYWORD_RE.findall(business.founding_story)}
+        if "family" in hits:
+            family_tag = _STORY_TAGS["family"]
+        if "immigrant" in hits:
+            immigrant_tag = _STORY_TAGS["immigrant"]
+    
+    # Recognition-based tags
+    award_tag = "award-winning" if business.recognition else None
+    
+    # Neighborhood heritage tags
+    neighborhood = business.neighborhood
+    neighborhood_tag = None
+    if neighborhood:
+        neighborhood_tag = (
+            _NEIGHBORHOOD_TAGS.get(neighborhood)
+            or f"{neighborhood.lower().replace(' ', '-')}-heritage"
+        )
+    
+    fragment = _tag_fragment(
+        (era_tag, age_tag, family_tag, immigrant_tag, award_tag, neighborhood_tag)
+    )
+    given = [tag for tag in business.search_tags if tag not in _FIELD_DERIVED_TAGS]
+    if given:
+        return tuple(fragment.union(given))
+    return tuple(fragment)
 
 class LegacyBusinessSummary(BaseModel):
     """Lightweight model for search results and list views"""
@@ -442,28 +601,92 @@ class LegacyBusinessSummary(BaseModel):
     demo_highlights: List[str] = Field(default_factory=list)
     heritage_score: Optional[int]
     current_status: Optional[str]
+    
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any]) -> "LegacyBusinessSummary":
+        """Build from a complete, already-validated record without re-validating"""
+        return cls.model_construct(**data)
+    
+    def fast_dict(self) -> Dict[str, Any]:
+        """
+        Flat field dict read straight from the instance, skipping pydantic's
+        schema-driven dump. Every field is already JSON-native; list values
+        are shared with the model, not copied.
+        """
+        values = self.__dict__
+        return {key: values[key] for key in _SUMMARY_FIELDS}
+    
+    @cached_property
+    def json_dict(self) -> Dict[str, Any]:
+        """JSON-ready dump computed once per instance; shared, so treat as read-only"""
+        return self.fast_dict()
+
+_SUMMARY_FIELDS = tuple(LegacyBusinessSummary.model_fields)
+
+# Row checks for LegacyBusiness.bulk_construct
+_REQUIRED_FIELDS = frozenset(
+    name for name, field in LegacyBusiness.model_fields.items() if field.is_required()
+)
+_NESTED_FIELDS = ('location_history', 'ownership_history', 'recognition')
+_DATETIME_FIELDS = ('created_at', 'updated_at', 'last_verified')
+_STRING_TUPLE_FIELDS = (
+    'unique_features', 'signature_products', 'search_tags',
+    'demo_highlights', 'source_documents'
+)
+
+
+def _coerce_stored_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Copy of a JSON-shaped row with timestamps and string lists converted to
+    the model's types, or None if a timestamp doesn't parse
+    """
+    values = dict(row)
+    for name in _DATETIME_FIELDS:
+        value = values.get(name)
+        if isinstance(value, str):
+            try:
+                values[name] = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+    for name in _STRING_TUPLE_FIELDS:
+        value = values.get(name)
+        if value is not None:
+            values[name] = _intern_all(value)
+    return values
+
+# Core validators/serializers bound once, for per-row loops over Weaviate
+# results and batch ingest; same behavior as Model(**data) / model_validate
+validate_business = LegacyBusiness.__pydantic_validator__.validate_python
+validate_summary = LegacyBusinessSummary.__pydantic_validator__.validate_python
+dump_summaries_json = TypeAdapter(List[LegacyBusinessSummary]).dump_json
+
+# Shared immutable default: pydantic hands the same tuple to every search
+# instead of building a new list per request
+DEFAULT_SEARCH_FIELDS = ("founding_story", "cultural_significance", "business_name")
 
 class LegacyBusinessSearch(BaseModel):
     """Search query model with advanced filtering"""
+    model_config = ConfigDict(extra="ignore")
+    
     query: str = Field(..., description="Full text search query")
     
     # Geographic filters
-    neighborhood: Optional[NeighborhoodEnum] = None
-    neighborhoods: List[NeighborhoodEnum] = Field(default_factory=list)
+    neighborhood: Optional[Neighborhood] = None
+    neighborhoods: Tuple[Neighborhood, ...] = ()
     
     # Temporal filters
-    founding_year_min: Optional[int] = Field(None, ge=1850, le=2024)
-    founding_year_max: Optional[int] = Field(None, ge=1850, le=2024)
+    founding_year_min: Optional[Year] = None
+    founding_year_max: Optional[Year] = None
     
     # Business filters
     business_type: Optional[str] = None
-    business_types: List[str] = Field(default_factory=list)
-    current_status: Optional[BusinessStatusEnum] = None
+    business_types: Tuple[str, ...] = ()
+    current_status: Optional[BusinessStatus] = None
     
     # Content filters
-    tags: List[str] = Field(default_factory=list)
+    tags: Tuple[str, ...] = ()
     has_recognition: Optional[bool] = None
-    heritage_score_min: Optional[int] = Field(None, ge=0, le=100)
+    heritage_score_min: Optional[Score] = None
     
     # Search behavior
     limit: int = Field(default=10, ge=1, le=100)
@@ -471,25 +694,60 @@ class LegacyBusinessSearch(BaseModel):
     include_inactive: bool = Field(default=False)
     
     # Semantic search options
-    similarity_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
-    search_fields: List[str] = Field(
-        default_factory=lambda: ["founding_story", "cultural_significance", "business_name"],
+    similarity_threshold: Confidence = 0.7
+    search_fields: Tuple[str, ...] = Field(
+        default=DEFAULT_SEARCH_FIELDS,
         description="Fields to include in semantic search"
     )
+    
+    @field_validator('tags')
+    @classmethod
+    def intern_tags(cls, v: Tuple[str, ...]) -> Tuple[str, ...]:
+        return _intern_all(v)
+    
+    def matches_tags(self, business: LegacyBusiness) -> bool:
+        """True if the business carries every requested tag"""
+        return not self.tags or business.tag_set.issuperset(self.tags)
 
 class ExtractionMetadata(BaseModel):
     """Metadata for PDF extraction results"""
     source_file: str
     extraction_timestamp: datetime
     confidence_scores: Dict[str, float] = Field(default_factory=dict)
-    extracted_fields: List[str] = Field(default_factory=list)
+    extracted_fields: Tuple[str, ...] = ()
     processing_time_seconds: float
     extraction_method: str = "llama_parse"
 
+class LegacyBusinessMutable(LegacyBusiness):
+    """
+    Ingest-time draft populated field by field by the extractor.
+
+    Assignment is not validated, so filling in metadata doesn't re-run
+    field and cross-field validation on every write; call finalize() once
+    the record is complete to get a validated LegacyBusiness.
+    """
+    model_config = ConfigDict(validate_assignment=False)
+    
+    def finalize(self) -> LegacyBusiness:
+        """Validate the populated draft once and return a LegacyBusiness"""
+        return LegacyBusiness.model_validate(self.model_dump())
+
 class LegacyBusinessExtracted(LegacyBusiness):
     """Extended model including extraction metadata"""
     extraction_metadata: Optional[ExtractionMetadata] = None
     raw_extracted_text: Optional[str] = Field(
         None,
         description="Raw text extracted from PDF before structuring"
-    )
\ No newline at end of file
+    )
+
+# Validators and serializers are built at class creation unless a forward
+# reference left a model incomplete; finish any such model at import so no
+# request triggers the core-schema build
+for _model in (
+    LocationHistory, Recognition, OwnershipHistory, LegacyBusiness,
+    LegacyBusinessSummary, LegacyBusinessSearch, ExtractionMetadata,
+    LegacyBusinessExtracted, LegacyBusinessMutable,
+):
+    if not _model.__pydantic_complete__:
+        _model.model_rebuild()
+del _model
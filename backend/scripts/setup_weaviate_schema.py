@@ -7,505 +7,1060 @@ Creates and configures Weaviate schema optimized for our LegacyBusiness data mod
 Includes proper vectorization settings, performance optimization, and validation.
 
 Usage:
-    python scripts/setup_weaviate_schema.py [--reset] [--validate-only]
+    python scripts/setup_weaviate_schema.py [--reset] [--validate-only] [--insert-sample] [--async] [--cache] [--search-repeat N] [--sample-file PATH] [--dump-schema PATH] [-q | -v]
 """
 
 import os
 import sys
 import time
 import json
+import atexit
+import logging
 import asyncio
-from typing import Dict, Any, List, Optional
+import sqlite3
+import hashlib
+import threading
+from array import array
+from itertools import islice
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from collections import OrderedDict
+from typing import Annotated, Dict, Any, Iterable, Iterator, List, Literal, Optional, Tuple, Union, get_args, get_origin
 from pathlib import Path
 
 # Add backend to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
+from models.legacy_business import LegacyBusiness, NeighborhoodEnum, BusinessStatusEnum, VectorizeHint
+
+logger = logging.getLogger(__name__)
+
 try:
-    import weaviate
-    from weaviate.classes.config import Configure, Property, DataType
-    from weaviate.classes.init import Auth
-    WEAVIATE_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    WEAVIATE_AVAILABLE = False
-    print("⚠️  Weaviate client not available. Install with: uv add weaviate-client")
+    ORJSON_AVAILABLE = False
+
+# The weaviate client (grpc, httpx and friends) is imported on first
+# connect, not at module import; None until then.
+WEAVIATE_AVAILABLE: Optional[bool] = None
+
+
+# Sample LegacyBusiness records for --insert-sample
+SAMPLE_BUSINESSES = [
+    {
+        "business_name": "The Wok Shop",
+        "founding_year": 1972,
+        "current_address": "718 Grant Avenue",
+        "neighborhood": "Chinatown",
+        "business_type": "Kitchen Supply Store",
+        "founding_story": "Founded after Nixon's 1972 China trip when Americans became interested in authentic Chinese cooking. Started by importing traditional woks and cooking equipment directly from China.",
+        "cultural_significance": "Serves as cultural ambassador teaching wok cooking to international audience. Bridge between traditional Chinese cooking techniques and American home kitchens.",
+        "physical_traditions": "Original 1970s pagoda-style neon sign. Traditional woks hanging from ceiling like roasted ducks in Chinatown markets.",
+        "unique_features": ["Original 1970s pagoda neon sign", "Woks hanging from ceiling", "International shipping worldwide"],
+        "signature_products": ["Traditional carbon steel woks", "Bamboo steamers", "Chinese cooking utensils"],
+        "demo_highlights": ["Featured on PBS cooking shows", "International customer base", "50+ years serving SF Chinatown"],
+        "search_tags": ["family-owned", "chinatown-heritage", "cooking-equipment", "cultural-bridge"],
+        "current_status": "active",
+        "heritage_score": 92,
+        "created_at": "2024-01-01T00:00:00Z"
+    }
+]
+
+
+# Connected clients shared by every WeaviateSchemaSetup in the process,
+# keyed by URL and a hash of the API key, so repeated setups in one
+# worker or test run skip the HTTP/gRPC handshake
+_CLIENT_POOL: Dict[Tuple[str, str], Any] = {}
+_CLIENT_POOL_LOCK = threading.RLock()
+
+
+def _pool_key(url: str, api_key: Optional[str]) -> Tuple[str, str]:
+    key_hash = hashlib.sha256(api_key.encode()).hexdigest() if api_key else ""
+    return url, key_hash
+
+
+@atexit.register
+def _close_pooled_clients():
+    """Close every pooled client at interpreter shutdown"""
+    with _CLIENT_POOL_LOCK:
+        for client in _CLIENT_POOL.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _CLIENT_POOL.clear()
+
+
+class QueryResultCache:
+    """
+    TTL + LRU cache of near_text results, scoped by collection, limit and
+    requested metadata so differently-shaped queries never share an entry.
+    
+    Only queries that are identical after strip/casefold hit an entry,
+    skipping both the server-side OpenAI embedding and the vector search.
+    Reworded queries always miss: near_text ranks by meaning, and a cheap
+    local similarity can't tell "bakery" from "not a bakery".
+    """
+    
+    def __init__(self, ttl_seconds: float = 600, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, Tuple], Tuple[Any, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _key(query: str, scope: Tuple) -> Tuple[str, Tuple]:
+        normalized = query.strip().casefold().encode()
+        return hashlib.blake2b(normalized, digest_size=16).hexdigest(), scope
+    
+    def lookup(self, query: str, scope: Tuple) -> Optional[Any]:
+        key = self._key(query, scope)
+        entry = self._entries.get(key)
+        if entry is not None:
+            results, expires_at = entry
+            if expires_at >= time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return results
+            del self._entries[key]
+        self.misses += 1
+        return None
+    
+    def store(self, query: str, scope: Tuple, results: Any):
+        key = self._key(query, scope)
+        self._entries[key] = (results, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        self._entries.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def chunks(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """Yield successive lists of up to `size` items"""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        iso = value.isoformat()
+        return iso + "Z" if value.tzinfo is None else iso.replace("+00:00", "Z")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dump_json(obj: Any) -> bytes:
+    """
+    Indented UTF-8 JSON bytes, via orjson when it is installed. Datetimes
+    are written as ISO 8601 with naive values treated as UTC ("...Z").
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default).encode()
+
+
+def load_objects(path: Path) -> List[Dict[str, Any]]:
+    """Read objects to ingest from a JSON array or a JSON Lines file"""
+    loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+    raw = path.read_bytes()
+    if raw.lstrip().startswith(b"["):
+        return loads(raw)
+    return [loads(line) for line in raw.splitlines() if line.strip()]
+
+
+# Properties validate_schema requires, and the ones that must be vectorized
+EXPECTED_PROPERTIES = frozenset({
+    "business_name", "founding_story", "cultural_significance",
+    "neighborhood", "business_type", "founding_year"
+})
+KEY_VECTORIZED_PROPERTIES = frozenset(
+    name for name, field in LegacyBusiness.model_fields.items()
+    if (field.json_schema_extra or {}).get("vectorize") is VectorizeHint.PRIMARY
+)
+
+
+# Properties that get a filterable / BM25-searchable inverted index; every
+# other stored property skips those index writes. Numeric facets also get
+# range filters.
+FILTERABLE_PROPERTIES = frozenset({
+    "business_name", "neighborhood", "business_type", "business_category",
+    "current_status", "search_tags", "founding_year", "heritage_score"
+})
+SEARCHABLE_PROPERTIES = frozenset({
+    "business_name", "founding_story", "cultural_significance", "physical_traditions",
+    "community_impact", "historical_significance", "unique_features",
+    "signature_products", "demo_highlights", "search_tags"
+})
+
+_SCALAR_DATA_TYPES = {str: "text", int: "int", float: "number", bool: "boolean", datetime: "date"}
+
+
+def _weaviate_data_type(annotation: Any) -> str:
+    """Weaviate dataType for a LegacyBusiness field annotation"""
+    origin = get_origin(annotation)
+    if origin is Union:
+        # Optional[X]: LegacyBusiness has no other unions
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+        return _weaviate_data_type(annotation)
+    if origin is Annotated:
+        return _weaviate_data_type(get_args(annotation)[0])
+    if origin is Literal:
+        return _SCALAR_DATA_TYPES[type(get_args(annotation)[0])]
+    if origin in (tuple, list):
+        return _weaviate_data_type(get_args(annotation)[0]) + "[]"
+    return _SCALAR_DATA_TYPES[annotation]
+
+
+def _legacy_business_properties() -> List[Dict[str, Any]]:
+    """
+    Weaviate property definitions generated from the LegacyBusiness fields
+    that carry a `vectorize` hint, in model order.
+    """
+    properties = []
+    for name, field in LegacyBusiness.model_fields.items():
+        hint = (field.json_schema_extra or {}).get("vectorize")
+        if hint is None:
+            continue
+        
+        data_type = _weaviate_data_type(field.annotation)
+        prop = {
+            "name": name,
+            "dataType": [data_type],
+            "description": field.description,
+            "indexFilterable": name in FILTERABLE_PROPERTIES,
+        }
+        if data_type.startswith("text"):
+            prop["indexSearchable"] = name in SEARCHABLE_PROPERTIES
+        elif prop["indexFilterable"] and data_type in ("int", "number"):
+            prop["indexRangeFilters"] = True
+        
+        vectorizer = {"skip": hint is VectorizeHint.SKIP}
+        if hint is VectorizeHint.PRIMARY:
+            vectorizer["vectorizePropertyName"] = False
+        prop["moduleConfig"] = {"text2vec-openai": vectorizer}
+        properties.append(prop)
+    return properties
+
+
+# Static Weaviate class definition for LegacyBusiness, generated from the
+# model once at import. get_legacy_business_schema() fills in the
+# collection name per instance.
+_LEGACY_BUSINESS_SCHEMA_TEMPLATE: Dict[str, Any] = {
+    "description": "San Francisco Legacy Business Registry with rich narrative content for semantic search",
+    "vectorizer": "text2vec-openai",  # Requires OpenAI API key
+    "moduleConfig": {
+        "text2vec-openai": {
+            "model": "text-embedding-3-small",  # Latest, cost-effective model
+            "dimensions": 1536,  # Standard dimension for this model
+            "type": "text",
+            "vectorizeClassName": False  # Don't vectorize class name
+        }
+    },
+    "properties": _legacy_business_properties()
+}
+
+# HNSW vector compression per `quantization` setting. SQ stores int8 codes
+# (about 4x less vector memory) and rescores the top candidates against
+# the full vectors, so recall stays close to uncompressed.
+Quantization = Literal["none", "sq", "pq", "bq"]
+_VECTOR_INDEX_CONFIGS: Dict[str, Dict[str, Any]] = {
+    "none": {},
+    "sq": {"sq": {"enabled": True, "trainingLimit": 100000, "rescoreLimit": 20}},
+    "pq": {"pq": {"enabled": True, "trainingLimit": 100000}},
+    "bq": {"bq": {"enabled": True}},
+}
+
+
+# Stored properties in schema order, and the date-typed ones among them
+STORED_PROPERTIES: Tuple[str, ...] = tuple(
+    prop["name"] for prop in _LEGACY_BUSINESS_SCHEMA_TEMPLATE["properties"]
+)
+DATE_PROPERTIES: Tuple[str, ...] = tuple(
+    prop["name"] for prop in _LEGACY_BUSINESS_SCHEMA_TEMPLATE["properties"]
+    if prop["dataType"] == ["date"]
+)
+
+# Vectorized properties in schema order; their text is what gets embedded
+VECTORIZED_PROPERTIES: Tuple[str, ...] = tuple(
+    prop["name"] for prop in _LEGACY_BUSINESS_SCHEMA_TEMPLATE["properties"]
+    if not prop["moduleConfig"]["text2vec-openai"]["skip"]
+)
+
+
+def prepare_objects(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Re-imported rows as the stored properties of a LegacyBusiness, with
+    search_tags generated where a row has none. Rows that already look
+    valid skip full validation; malformed ones raise ValidationError.
+    """
+    include = set(STORED_PROPERTIES)
+    objects = []
+    for business in LegacyBusiness.bulk_construct(rows):
+        obj = business.model_dump(mode="json", include=include, exclude_none=True)
+        # Weaviate dates need an offset; naive timestamps are UTC, as in dump_json()
+        for name in DATE_PROPERTIES:
+            if name in obj:
+                obj[name] = _json_default(getattr(business, name))
+        objects.append(obj)
+    return objects
+
 
-from models.legacy_business import LegacyBusiness, NeighborhoodEnum, BusinessStatusEnum
+DEFAULT_EMBEDDING_CACHE = Path.home() / ".cache" / "legacybiz" / "embeddings.sqlite"
+
+
+class EmbeddingCache:
+    """
+    Client-side embeddings for ingested objects, persisted in SQLite and
+    keyed by a blake2b digest of the model, dimensions and embedded text.
+    Objects inserted with these vectors bypass the server-side vectorizer,
+    so re-running an ingest only embeds records whose content changed.
+    Model and dimensions default to the collection's text2vec-openai
+    settings, so a schema change invalidates earlier entries.
+    """
+    
+    BATCH_SIZE = 100  # Inputs per OpenAI embeddings request
+    
+    def __init__(self, path: Path = DEFAULT_EMBEDDING_CACHE, model: Optional[str] = None, dimensions: Optional[int] = None):
+        text2vec = _LEGACY_BUSINESS_SCHEMA_TEMPLATE["moduleConfig"]["text2vec-openai"]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Shared with abulk_insert's worker threads; _lock serializes access
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._db.execute("CREATE TABLE IF NOT EXISTS embeddings (digest BLOB PRIMARY KEY, vector BLOB NOT NULL)")
+        self._openai = None
+        self.model = model or text2vec["model"]
+        self.dimensions = dimensions or text2vec["dimensions"]
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def content(obj: Dict[str, Any]) -> str:
+        """
+        Text embedded for this object: its vectorized property values, one
+        per line. This is not the exact string Weaviate's text2vec module
+        builds server-side, so a cached vector can differ slightly from the
+        one the server would compute for the same object.
+        """
+        parts = []
+        for name in VECTORIZED_PROPERTIES:
+            value = obj.get(name)
+            if isinstance(value, (list, tuple)):
+                parts.extend(str(item) for item in value)
+            elif value:
+                parts.append(str(value))
+        return "\n".join(parts)
+    
+    def _digest(self, text: str) -> bytes:
+        return hashlib.blake2b(f"{self.model}:{self.dimensions}:{text}".encode(), digest_size=16).digest()
+    
+    def vectors_for(self, objects: List[Dict[str, Any]]) -> List[Optional[List[float]]]:
+        """Embedding per object, from the cache or the API; None for objects with no text"""
+        with self._lock:
+            return self._vectors_for(objects)
+    
+    def _vectors_for(self, objects: List[Dict[str, Any]]) -> List[Optional[List[float]]]:
+        texts = [self.content(obj) for obj in objects]
+        digests = [self._digest(text) if text else None for text in texts]
+        wanted = dict.fromkeys(d for d in digests if d is not None)
+        
+        vectors: Dict[bytes, List[float]] = {}
+        for group in chunks(wanted, 500):
+            rows = self._db.execute(
+                f"SELECT digest, vector FROM embeddings WHERE digest IN ({','.join('?' * len(group))})",
+                group
+            )
+            for digest, blob in rows:
+                vectors[digest] = array("f", blob).tolist()
+        self.hits += len(vectors)
+        
+        missing = {d: text for d, text in zip(digests, texts) if d is not None and d not in vectors}
+        self.misses += len(missing)
+        for group in chunks(missing.items(), self.BATCH_SIZE):
+            embedded = self._embed([text for _, text in group])
+            rows = []
+            for (digest, _), vector in zip(group, embedded):
+                vectors[digest] = vector
+                rows.append((digest, array("f", vector).tobytes()))
+            self._db.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?)", rows)
+            self._db.commit()
+        
+        return [vectors[d] if d is not None else None for d in digests]
+    
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        if self._openai is None:
+            from openai import OpenAI
+            self._openai = OpenAI()
+        response = self._openai.embeddings.create(model=self.model, input=texts, dimensions=self.dimensions)
+        return [item.embedding for item in response.data]
+    
+    def close(self):
+        self._db.close()
+
+
+@dataclass(slots=True)
+class CollectionStats:
+    """Result of WeaviateSchemaSetup.get_collection_stats()"""
+    collection_name: str
+    total_objects: Optional[int] = None  # None when only presence was probed
+    populated: bool = False
+    status: str = "ready"
+    error: Optional[str] = None
 
 
 class WeaviateSchemaSetup:
     """Handles Weaviate schema creation and validation for LegacyBusiness model"""
     
-    def __init__(self, url: Optional[str] = None, api_key: Optional[str] = None):
+    _weaviate = None
+    _properties = None
+    
+    @classmethod
+    def _lazy_import_weaviate(cls):
+        """Import the weaviate client once, on first use; None if it isn't installed"""
+        global WEAVIATE_AVAILABLE
+        if cls._weaviate is None and WEAVIATE_AVAILABLE is not False:
+            try:
+                import weaviate
+                import weaviate.classes.init
+            except ImportError:
+                WEAVIATE_AVAILABLE = False
+                logger.warning("⚠️  Weaviate client not available. Install with: uv add weaviate-client")
+            else:
+                WEAVIATE_AVAILABLE = True
+                cls._weaviate = weaviate
+        return cls._weaviate
+    
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        batch_size: int = 200,
+        concurrent_requests: int = 4,
+        enable_cache: bool = False,
+        ttl_seconds: float = 600,
+        max_entries: int = 1024,
+        quantization: Quantization = "sq",
+        client_side_embed: bool = False,
+        embedding_cache_path: Optional[Path] = None
+    ):
+        if quantization not in _VECTOR_INDEX_CONFIGS:
+            raise ValueError(f"Unknown quantization {quantization!r}; expected one of {sorted(_VECTOR_INDEX_CONFIGS)}")
         self.url = url or os.getenv("WEAVIATE_URL", "http://localhost:8080")
         self.api_key = api_key or os.getenv("WEAVIATE_API_KEY")
         self.client = None
+        self._collection = None
+        self.async_client = None
         self.collection_name = "LegacyBusiness"
+        self.batch_size = batch_size
+        self.concurrent_requests = concurrent_requests
+        self.quantization = quantization
+        self._pooled = False
+        self.query_cache = (
+            QueryResultCache(ttl_seconds=ttl_seconds, max_entries=max_entries)
+            if enable_cache else None
+        )
+        self.embedding_cache = (
+            EmbeddingCache(embedding_cache_path or DEFAULT_EMBEDDING_CACHE)
+            if client_side_embed else None
+        )
+    
+    def _invalidate_query_cache(self):
+        """Drop cached search results after the collection's contents change"""
+        if self.query_cache is not None:
+            self.query_cache.clear()
+    
+    def _open_client(self):
+        weaviate = self._weaviate
+        auth = weaviate.classes.init.Auth.api_key(self.api_key) if self.api_key else None
+        return weaviate.connect_to_custom(
+            http_host=self.url.replace("http://", "").replace("https://", ""),
+            http_port=8080,  # Default Weaviate port
+            http_secure=self.url.startswith("https://"),
+            auth=auth
+        )
         
-    def connect(self) -> bool:
-        """Establish connection to Weaviate"""
-        if not WEAVIATE_AVAILABLE:
-            print("❌ Weaviate client library not available")
+    def connect(self, fresh: bool = False) -> bool:
+        """
+        Establish connection to Weaviate.
+        
+        Reuses the process-wide pooled client for this URL and key; pass
+        fresh=True for a private connection (e.g. schema-mutating background
+        jobs) that close() will actually tear down.
+        """
+        weaviate = self._lazy_import_weaviate()
+        if weaviate is None:
+            logger.error("❌ Weaviate client library not available")
             return False
             
+        self._collection = None
         try:
-            auth = Auth.api_key(self.api_key) if self.api_key else None
-            self.client = weaviate.connect_to_custom(
-                http_host=self.url.replace("http://", "").replace("https://", ""),
-                http_port=8080,  # Default Weaviate port
-                http_secure=self.url.startswith("https://"),
-                auth=auth
-            )
+            if fresh:
+                self.client = self._open_client()
+                self._pooled = False
+            else:
+                key = _pool_key(self.url, self.api_key)
+                with _CLIENT_POOL_LOCK:
+                    client = _CLIENT_POOL.get(key)
+                    if client is None or not client.is_connected():
+                        client = self._open_client()
+                        _CLIENT_POOL[key] = client
+                self.client = client
+                self._pooled = True
             
             # Test connection
             if self.client.is_ready():
-                print(f"✅ Connected to Weaviate at {self.url}")
+                logger.info("✅ Connected to Weaviate at %s", self.url)
+                return True
+            else:
+                logger.error("❌ Weaviate not ready at %s", self.url)
+                return False
+                
+        except Exception as e:
+            logger.error("❌ Failed to connect to Weaviate: %s", e)
+            return False
+    
+    @property
+    def collection(self):
+        """The collection handle on the current client, fetched once per connection"""
+        if self._collection is None:
+            self._collection = self.client.collections.get(self.collection_name)
+        return self._collection
+    
+    async def aconnect(self) -> bool:
+        """Open a private async client; its requests share one gRPC channel"""
+        weaviate = self._lazy_import_weaviate()
+        if weaviate is None:
+            logger.error("❌ Weaviate client library not available")
+            return False
+        
+        secure = self.url.startswith("https://")
+        host = self.url.replace("http://", "").replace("https://", "")
+        try:
+            self.async_client = weaviate.use_async_with_custom(
+                http_host=host,
+                http_port=8080,  # Default Weaviate port
+                http_secure=secure,
+                grpc_host=host,
+                grpc_port=50051,  # Default Weaviate gRPC port
+                grpc_secure=secure,
+                auth_credentials=weaviate.classes.init.Auth.api_key(self.api_key) if self.api_key else None
+            )
+            await self.async_client.connect()
+            
+            if await self.async_client.is_ready():
+                logger.info("✅ Connected to Weaviate at %s (async)", self.url)
                 return True
             else:
-                print(f"❌ Weaviate not ready at {self.url}")
+                logger.error("❌ Weaviate not ready at %s", self.url)
                 return False
                 
         except Exception as e:
-            print(f"❌ Failed to connect to Weaviate: {e}")
+            logger.error("❌ Failed to connect to Weaviate: %s", e)
             return False
     
     def get_legacy_business_schema(self) -> Dict[str, Any]:
         """
         Generate Weaviate schema for LegacyBusiness model.
         Optimized for semantic search with proper vectorization settings.
+        The nested property definitions are shared; treat them as read-only.
+        This dict is the reference form; create_schema() sends the typed
+        equivalent from _collection_config().
+        """
+        schema = {"class": self.collection_name, **_LEGACY_BUSINESS_SCHEMA_TEMPLATE}
+        vector_index_config = _VECTOR_INDEX_CONFIGS[self.quantization]
+        if vector_index_config:
+            schema["vectorIndexType"] = "hnsw"
+            schema["vectorIndexConfig"] = vector_index_config
+        return schema
+    
+    @classmethod
+    def _typed_properties(cls) -> List[Any]:
+        """
+        The schema template's properties as v4 Property objects, built once.
+        Requires the weaviate client to have been imported.
         """
+        if cls._properties is None:
+            from weaviate.classes.config import DataType, Property
+            
+            data_types = {
+                "text": DataType.TEXT,
+                "text[]": DataType.TEXT_ARRAY,
+                "int": DataType.INT,
+                "number": DataType.NUMBER,
+                "date": DataType.DATE,
+            }
+            properties = []
+            for prop in _LEGACY_BUSINESS_SCHEMA_TEMPLATE["properties"]:
+                vectorizer = prop["moduleConfig"]["text2vec-openai"]
+                properties.append(Property(
+                    name=prop["name"],
+                    data_type=data_types[prop["dataType"][0]],
+                    description=prop["description"],
+                    index_filterable=prop.get("indexFilterable"),
+                    index_searchable=prop.get("indexSearchable"),
+                    index_range_filters=prop.get("indexRangeFilters"),
+                    skip_vectorization=vectorizer["skip"],
+                    vectorize_property_name=vectorizer.get("vectorizePropertyName", False)
+                ))
+            cls._properties = properties
+        return cls._properties
+    
+    def _collection_config(self) -> Dict[str, Any]:
+        """Keyword arguments for collections.create(), the typed form of get_legacy_business_schema()"""
+        from weaviate.classes.config import Configure
+        
+        text2vec = _LEGACY_BUSINESS_SCHEMA_TEMPLATE["moduleConfig"]["text2vec-openai"]
+        quantizers = {
+            "none": lambda: None,
+            "sq": lambda: Configure.VectorIndex.Quantizer.sq(training_limit=100000, rescore_limit=20),
+            "pq": lambda: Configure.VectorIndex.Quantizer.pq(training_limit=100000),
+            "bq": lambda: Configure.VectorIndex.Quantizer.bq(),
+        }
         return {
-            "class": self.collection_name,
-            "description": "San Francisco Legacy Business Registry with rich narrative content for semantic search",
-            "vectorizer": "text2vec-openai",  # Requires OpenAI API key
-            "moduleConfig": {
-                "text2vec-openai": {
-                    "model": "text-embedding-3-small",  # Latest, cost-effective model
-                    "dimensions": 1536,  # Standard dimension for this model
-                    "type": "text",
-                    "vectorizeClassName": False  # Don't vectorize class name
-                }
-            },
-            "properties": [
-                # === CORE IDENTITY === (Medium vectorization weight)
-                {
-                    "name": "business_name",
-                    "dataType": ["text"],
-                    "description": "Official business name - primary identifier",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False, "vectorizePropertyName": False}
-                    }
-                },
-                {
-                    "name": "legal_name", 
-                    "dataType": ["text"],
-                    "description": "Legal entity name if different from DBA",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}  # Skip vectorization for legal metadata
-                    }
-                },
-                {
-                    "name": "dba_name",
-                    "dataType": ["text"], 
-                    "description": "Doing Business As name",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                
-                # === TEMPORAL DATA === (Structured, no vectorization)
-                {
-                    "name": "founding_year",
-                    "dataType": ["int"],
-                    "description": "Year the business was established",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                {
-                    "name": "years_at_current_location", 
-                    "dataType": ["int"],
-                    "description": "Years at current address",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                
-                # === LOCATION DATA === (Mixed vectorization)
-                {
-                    "name": "current_address",
-                    "dataType": ["text"],
-                    "description": "Current street address",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}  # Skip - not semantically meaningful
-                    }
-                },
-                {
-                    "name": "neighborhood",
-                    "dataType": ["text"],
-                    "description": "San Francisco neighborhood",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}  # Include - culturally significant
-                    }
-                },
-                
-                # === BUSINESS CLASSIFICATION === (Medium vectorization)
-                {
-                    "name": "business_type",
-                    "dataType": ["text"],
-                    "description": "Primary business category",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                {
-                    "name": "business_category",
-                    "dataType": ["text"],
-                    "description": "Official legacy business category",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                
-                # === RICH NARRATIVE CONTENT === (HIGH vectorization priority)
-                {
-                    "name": "founding_story",
-                    "dataType": ["text"],
-                    "description": "Origin story and early history - PRIMARY SEARCH CONTENT",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False, "vectorizePropertyName": False}
-                    }
-                },
-                {
-                    "name": "cultural_significance", 
-                    "dataType": ["text"],
-                    "description": "Cultural contribution to neighborhood - PRIMARY SEARCH CONTENT",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False, "vectorizePropertyName": False}
-                    }
-                },
-                {
-                    "name": "physical_traditions",
-                    "dataType": ["text"],
-                    "description": "Physical features and traditional practices",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                {
-                    "name": "community_impact",
-                    "dataType": ["text"], 
-                    "description": "Community benefits and social contributions",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                {
-                    "name": "historical_significance",
-                    "dataType": ["text"],
-                    "description": "Role in historical events",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                
-                # === DISTINCTIVE FEATURES === (Arrays for flexible search)
-                {
-                    "name": "unique_features",
-                    "dataType": ["text[]"],
-                    "description": "Distinctive and memorable characteristics",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                {
-                    "name": "signature_products",
-                    "dataType": ["text[]"],
-                    "description": "Flagship products and services",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                {
-                    "name": "demo_highlights",
-                    "dataType": ["text[]"],
-                    "description": "Key talking points for presentations",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                
-                # === SEARCH METADATA === (Mixed)
-                {
-                    "name": "search_tags",
-                    "dataType": ["text[]"],
-                    "description": "Generated and manual search tags",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": False}
-                    }
-                },
-                
-                # === OPERATIONAL STATUS === (Structured, no vectorization)
-                {
-                    "name": "current_status",
-                    "dataType": ["text"],
-                    "description": "Current operational status",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                {
-                    "name": "status_notes",
-                    "dataType": ["text"],
-                    "description": "Additional status information",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                
-                # === METADATA === (No vectorization - for filtering only)
-                {
-                    "name": "application_id",
-                    "dataType": ["text"],
-                    "description": "Legacy Business Registry application ID",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                {
-                    "name": "heritage_score",
-                    "dataType": ["int"],
-                    "description": "Calculated heritage significance score (0-100)",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                {
-                    "name": "extraction_confidence",
-                    "dataType": ["number"],
-                    "description": "PDF extraction confidence score",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                
-                # === TEMPORAL METADATA === (No vectorization)
-                {
-                    "name": "created_at",
-                    "dataType": ["date"],
-                    "description": "Record creation timestamp",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                {
-                    "name": "updated_at",
-                    "dataType": ["date"],
-                    "description": "Last update timestamp", 
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                },
-                {
-                    "name": "last_verified",
-                    "dataType": ["date"],
-                    "description": "Last verification timestamp",
-                    "moduleConfig": {
-                        "text2vec-openai": {"skip": True}
-                    }
-                }
-            ]
+            "name": self.collection_name,
+            "description": _LEGACY_BUSINESS_SCHEMA_TEMPLATE["description"],
+            "vectorizer_config": Configure.Vectorizer.text2vec_openai(
+                model=text2vec["model"],
+                dimensions=text2vec["dimensions"],
+                vectorize_collection_name=text2vec["vectorizeClassName"]
+            ),
+            "vector_index_config": Configure.VectorIndex.hnsw(quantizer=quantizers[self.quantization]()),
+            "properties": self._typed_properties(),
         }
     
+    def _wait_for_deletion(self, name: str, timeout: float = 10.0):
+        """Poll until `name` is gone, backing off from 10ms to 320ms between checks"""
+        deadline = time.monotonic() + timeout
+        delay = 0.01
+        while self.client.collections.exists(name):
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Collection {name} still present {timeout:g}s after delete")
+            time.sleep(delay)
+            delay = min(delay * 2, 0.32)
+    
     def create_schema(self, reset: bool = False) -> bool:
         """Create the LegacyBusiness schema in Weaviate"""
         if not self.client:
-            print("❌ No Weaviate connection")
+            logger.error("❌ No Weaviate connection")
             return False
             
         try:
-            # Check if collection exists
-            collections = self.client.collections.list_all()
-            collection_exists = self.collection_name in [c.name for c in collections]
+            # Check if collection exists (single-class lookup, not the full schema)
+            collection_exists = self.client.collections.exists(self.collection_name)
             
             if collection_exists:
                 if reset:
-                    print(f"🗑️  Deleting existing {self.collection_name} collection...")
+                    logger.info("🗑️  Deleting existing %s collection...", self.collection_name)
                     self.client.collections.delete(self.collection_name)
-                    time.sleep(2)  # Wait for deletion to complete
+                    self._collection = None
+                    self._invalidate_query_cache()
+                    self._wait_for_deletion(self.collection_name)
                 else:
-                    print(f"✅ Collection {self.collection_name} already exists (use --reset to recreate)")
+                    logger.info("✅ Collection %s already exists (use --reset to recreate)", self.collection_name)
                     return True
             
             # Create new collection
-            print(f"🏗️  Creating {self.collection_name} collection...")
-            schema = self.get_legacy_business_schema()
-            
-            collection = self.client.collections.create_from_dict(schema)
+            logger.info("🏗️  Creating %s collection...", self.collection_name)
+            collection = self.client.collections.create(**self._collection_config())
             
             if collection:
-                print(f"✅ Successfully created {self.collection_name} collection")
+                logger.info("✅ Successfully created %s collection", self.collection_name)
                 return True
             else:
-                print(f"❌ Failed to create {self.collection_name} collection")
+                logger.error("❌ Failed to create %s collection", self.collection_name)
                 return False
                 
         except Exception as e:
-            print(f"❌ Schema creation failed: {e}")
+            logger.error("❌ Schema creation failed: %s", e)
+            return False
+    
+    async def acreate_schema(self, reset: bool = False) -> bool:
+        """Async create_schema() on the async client"""
+        if not self.async_client:
+            logger.error("❌ No Weaviate connection")
+            return False
+        
+        collections = self.async_client.collections
+        try:
+            if await collections.exists(self.collection_name):
+                if reset:
+                    logger.info("🗑️  Deleting existing %s collection...", self.collection_name)
+                    await collections.delete(self.collection_name)
+                    self._invalidate_query_cache()
+                    
+                    delay = 0.01
+                    deadline = time.monotonic() + 10.0
+                    while await collections.exists(self.collection_name):
+                        if time.monotonic() >= deadline:
+                            raise TimeoutError(f"Collection {self.collection_name} still present 10s after delete")
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, 0.32)
+                else:
+                    logger.info("✅ Collection %s already exists (use --reset to recreate)", self.collection_name)
+                    return True
+            
+            logger.info("🏗️  Creating %s collection...", self.collection_name)
+            await collections.create(**self._collection_config())
+            logger.info("✅ Successfully created %s collection", self.collection_name)
+            return True
+            
+        except Exception as e:
+            logger.error("❌ Schema creation failed: %s", e)
             return False
     
     def validate_schema(self) -> bool:
         """Validate the created schema matches our expectations"""
         if not self.client:
-            print("❌ No Weaviate connection")
+            logger.error("❌ No Weaviate connection")
             return False
             
         try:
-            collection = self.client.collections.get(self.collection_name)
+            collection = self.collection
             config = collection.config.get()
             
-            print(f"📋 Validating {self.collection_name} schema...")
+            logger.info("📋 Validating %s schema...", self.collection_name)
             
             # Check vectorizer configuration
             vectorizer = config.vectorizer_config
             if vectorizer and hasattr(vectorizer, 'vectorizer'):
-                print(f"  ✅ Vectorizer: {vectorizer.vectorizer}")
+                logger.info("  ✅ Vectorizer: %s", vectorizer.vectorizer)
             else:
-                print("  ⚠️  No vectorizer configured")
+                logger.warning("  ⚠️  No vectorizer configured")
             
-            # Check properties
+            # One pass over the properties: name -> vectorization skipped
             properties = config.properties
-            expected_props = [
-                "business_name", "founding_story", "cultural_significance",
-                "neighborhood", "business_type", "founding_year"
-            ]
-            
-            existing_props = [prop.name for prop in properties]
-            missing_props = [prop for prop in expected_props if prop not in existing_props]
+            skipped = {
+                prop.name: getattr(getattr(prop, 'vectorizer_config', None), 'skip', False)
+                for prop in properties
+            }
             
+            missing_props = sorted(EXPECTED_PROPERTIES - skipped.keys())
             if missing_props:
-                print(f"  ❌ Missing properties: {missing_props}")
+                logger.error("  ❌ Missing properties: %s", missing_props)
                 return False
+            logger.info("  ✅ All %s properties configured", len(properties))
+            
+            disabled = sorted(name for name in KEY_VECTORIZED_PROPERTIES if skipped.get(name))
+            if disabled:
+                logger.warning("  ⚠️  Vectorization disabled for key properties: %s", disabled)
             else:
-                print(f"  ✅ All {len(properties)} properties configured")
-            
-            # Check vectorization settings for key fields
-            key_vectorized_fields = ["founding_story", "cultural_significance", "business_name"]
-            for prop in properties:
-                if prop.name in key_vectorized_fields:
-                    # Check if vectorization is enabled (not skipped)
-                    vectorizer_config = getattr(prop, 'vectorizer_config', None)
-                    if vectorizer_config and getattr(vectorizer_config, 'skip', False):
-                        print(f"  ⚠️  {prop.name} has vectorization disabled")
-                    else:
-                        print(f"  ✅ {prop.name} vectorization enabled")
+                logger.debug("  ✅ Key properties vectorized: %s", sorted(KEY_VECTORIZED_PROPERTIES))
             
-            print("✅ Schema validation completed successfully")
+            logger.info("✅ Schema validation completed successfully")
             return True
             
         except Exception as e:
-            print(f"❌ Schema validation failed: {e}")
+            logger.error("❌ Schema validation failed: %s", e)
             return False
     
-    def get_collection_stats(self) -> Dict[str, Any]:
-        """Get basic statistics about the collection"""
+    def validate_with_stats(self, approximate: bool = True) -> Tuple[bool, CollectionStats]:
+        """
+        validate_schema() with the stats read running concurrently on the
+        same client, so the pair costs one round trip of wall time.
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            stats = executor.submit(self.get_collection_stats, approximate)
+            valid = self.validate_schema()
+            return valid, stats.result()
+    
+    def get_collection_stats(self, approximate: bool = True) -> CollectionStats:
+        """
+        Get basic statistics about the collection.
+        
+        By default only probes whether any object exists (a one-object fetch
+        with no properties or vector) and leaves total_objects unset; pass
+        approximate=False for an exact aggregate count.
+        """
         if not self.client:
-            return {"error": "No connection"}
+            return CollectionStats(self.collection_name, status="error", error="No connection")
             
         try:
-            collection = self.client.collections.get(self.collection_name)
+            collection = self.collection
+            
+            if approximate:
+                probe = collection.query.fetch_objects(limit=1, include_vector=False, return_properties=[])
+                return CollectionStats(self.collection_name, populated=bool(probe.objects))
             
             # Get object count (this might be 0 if no data inserted yet)
             total_objects = collection.aggregate.over_all(total_count=True).total_count
             
-            return {
-                "collection_name": self.collection_name,
-                "total_objects": total_objects,
-                "status": "ready" if total_objects >= 0 else "error"
-            }
+            return CollectionStats(
+                self.collection_name,
+                total_objects=total_objects,
+                populated=total_objects > 0,
+                status="ready" if total_objects >= 0 else "error"
+            )
             
         except Exception as e:
-            return {"error": str(e)}
+            return CollectionStats(self.collection_name, status="error", error=str(e))
     
-    def insert_sample_data(self) -> bool:
+    def bulk_insert(
+        self,
+        objects: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        concurrent_requests: Optional[int] = None
+    ) -> int:
+        """
+        Insert objects through the client's batch API.
+        
+        Objects are sent in chunks of `batch_size` with `concurrent_requests`
+        requests in flight, so ingestion isn't one HTTP round trip (and one
+        vectorization call) per object. With client_side_embed, each object
+        carries its cached embedding instead. Objects that fail are retried
+        once. Returns the number of objects inserted.
+        """
+        if not self.client:
+            logger.error("❌ No Weaviate connection")
+            return 0
+        
+        batch_size = batch_size or self.batch_size
+        concurrent_requests = concurrent_requests or self.concurrent_requests
+        collection = self.collection
+        
+        inserted = 0
+        for chunk in chunks(objects, batch_size):
+            pending = chunk
+            for attempt in range(2):
+                with collection.batch.fixed_size(
+                    batch_size=batch_size,
+                    concurrent_requests=concurrent_requests
+                ) as batch:
+                    if self.embedding_cache is not None:
+                        for obj, vector in zip(pending, self.embedding_cache.vectors_for(pending)):
+                            batch.add_object(properties=obj, vector=vector)
+                    else:
+                        for obj in pending:
+                            batch.add_object(properties=obj)
+                
+                failed = collection.batch.failed_objects
+                inserted += len(pending) - len(failed)
+                if not failed:
+                    break
+                if attempt == 0:
+                    logger.warning("  ⚠️  Retrying %s failed objects", len(failed))
+                    pending = [error.object_.properties for error in failed]
+                else:
+                    logger.error("  ❌ %s objects failed after retry: %s", len(failed), failed[0].message)
+        
+        if inserted:
+            self._invalidate_query_cache()
+        return inserted
+    
+    async def abulk_insert(
+        self,
+        objects: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        concurrent_requests: Optional[int] = None
+    ) -> int:
+        """
+        Async bulk_insert(): one insert_many call per chunk, with up to
+        `concurrent_requests` chunks in flight on the async client.
+        """
+        if not self.async_client:
+            logger.error("❌ No Weaviate connection")
+            return 0
+        
+        batch_size = batch_size or self.batch_size
+        in_flight = asyncio.Semaphore(concurrent_requests or self.concurrent_requests)
+        collection = self.async_client.collections.get(self.collection_name)
+        
+        async def insert_chunk(chunk: List[Dict[str, Any]]) -> int:
+            async with in_flight:
+                pending = chunk
+                inserted = 0
+                if self.embedding_cache is not None:
+                    from weaviate.classes.data import DataObject
+                    vectors = await asyncio.to_thread(self.embedding_cache.vectors_for, pending)
+                    pending = [DataObject(properties=obj, vector=vector) for obj, vector in zip(pending, vectors)]
+                for attempt in range(2):
+                    result = await collection.data.insert_many(pending)
+                    inserted += len(pending) - len(result.errors)
+                    if not result.errors:
+                        break
+                    if attempt == 0:
+                        logger.warning("  ⚠️  Retrying %s failed objects", len(result.errors))
+                        pending = [pending[index] for index in result.errors]
+                    else:
+                        error = next(iter(result.errors.values()))
+                        logger.error("  ❌ %s objects failed after retry: %s", len(result.errors), error.message)
+                return inserted
+        
+        inserted = sum(await asyncio.gather(
+            *(insert_chunk(chunk) for chunk in chunks(objects, batch_size))
+        ))
+        if inserted:
+            self._invalidate_query_cache()
+        return inserted
+    
+    async def aprewarm_vectorizer(self, query: str = "traditional Chinese cooking equipment"):
+        """
+        Issue a throwaway near_text query so the vectorizer module's
+        connection to the embedding provider is open before the first real
+        search. Meant to run alongside abulk_insert(); failures are ignored.
+        """
+        if not self.async_client:
+            return
+        try:
+            collection = self.async_client.collections.get(self.collection_name)
+            await collection.query.near_text(query=query, limit=1)
+        except Exception:
+            pass
+    
+    def insert_sample_data(self, objects: Optional[List[Dict[str, Any]]] = None) -> bool:
         """Insert sample LegacyBusiness data for testing"""
         if not self.client:
-            print("❌ No Weaviate connection")
+            logger.error("❌ No Weaviate connection")
             return False
             
+        objects = objects if objects is not None else SAMPLE_BUSINESSES
+        
         try:
-            collection = self.client.collections.get(self.collection_name)
-            
-            # Create sample business based on our model
-            sample_business = {
-                "business_name": "The Wok Shop",
-                "founding_year": 1972,
-                "current_address": "718 Grant Avenue",
-                "neighborhood": "Chinatown",
-                "business_type": "Kitchen Supply Store",
-                "founding_story": "Founded after Nixon's 1972 China trip when Americans became interested in authentic Chinese cooking. Started by importing traditional woks and cooking equipment directly from China.",
-                "cultural_significance": "Serves as cultural ambassador teaching wok cooking to international audience. Bridge between traditional Chinese cooking techniques and American home kitchens.",
-                "physical_traditions": "Original 1970s pagoda-style neon sign. Traditional woks hanging from ceiling like roasted ducks in Chinatown markets.",
-                "unique_features": ["Original 1970s pagoda neon sign", "Woks hanging from ceiling", "International shipping worldwide"],
-                "signature_products": ["Traditional carbon steel woks", "Bamboo steamers", "Chinese cooking utensils"],
-                "demo_highlights": ["Featured on PBS cooking shows", "International customer base", "50+ years serving SF Chinatown"],
-                "search_tags": ["family-owned", "chinatown-heritage", "cooking-equipment", "cultural-bridge"],
-                "current_status": "active",
-                "heritage_score": 92,
-                "created_at": "2024-01-01T00:00:00Z"
-            }
-            
-            print("📝 Inserting sample data...")
-            result = collection.data.insert(sample_business)
+            logger.info("📝 Inserting %s sample objects...", len(objects))
+            inserted = self.bulk_insert(objects)
             
-            if result:
-                print(f"✅ Sample data inserted with UUID: {result}")
+            if inserted == len(objects):
+                logger.info("✅ Inserted %s sample objects", inserted)
                 return True
             else:
-                print("❌ Failed to insert sample data")
+                logger.error("❌ Inserted %s of %s sample objects", inserted, len(objects))
                 return False
                 
         except Exception as e:
-            print(f"❌ Sample data insertion failed: {e}")
+            logger.error("❌ Sample data insertion failed: %s", e)
             return False
     
-    def test_semantic_search(self) -> bool:
+    def test_semantic_search(self, query: str = "traditional Chinese cooking equipment", limit: int = 5) -> bool:
         """Test semantic search functionality"""
         if not self.client:
-            print("❌ No Weaviate connection")
+            logger.error("❌ No Weaviate connection")
             return False
             
         try:
-            collection = self.client.collections.get(self.collection_name)
+            logger.info("🔍 Testing semantic search...")
             
-            print("🔍 Testing semantic search...")
+            return_metadata = ("certainty", "distance")
+            scope = (self.collection_name, limit, return_metadata)
+            results = self.query_cache.lookup(query, scope) if self.query_cache else None
             
-            # Test semantic search query
-            results = collection.query.near_text(
-                query="traditional Chinese cooking equipment",
-                limit=5,
-                return_metadata=["certainty", "distance"]
-            )
+            if results is None:
+                # Test semantic search query
+                collection = self.collection
+                results = collection.query.near_text(
+                    query=query,
+                    limit=limit,
+                    return_metadata=list(return_metadata)
+                )
+                if self.query_cache is not None:
+                    self.query_cache.store(query, scope, results)
             
-            if results.objects:
-                print(f"✅ Semantic search returned {len(results.objects)} results")
-                for obj in results.objects:
-                    certainty = obj.metadata.certainty if obj.metadata else "unknown"
-                    print(f"  - {obj.properties.get('business_name', 'Unknown')} (certainty: {certainty})")
-                return True
-            else:
-                print("⚠️  Semantic search returned no results (collection may be empty)")
-                return True  # Still valid if empty
+            return self._report_search(results)
                 
         except Exception as e:
-            print(f"❌ Semantic search test failed: {e}")
+            logger.error("❌ Semantic search test failed: %s", e)
             return False
     
+    async def atest_semantic_search(self, query: str = "traditional Chinese cooking equipment", limit: int = 5) -> bool:
+        """Async test_semantic_search() on the async client"""
+        if not self.async_client:
+            logger.error("❌ No Weaviate connection")
+            return False
+            
+        try:
+            logger.info("🔍 Testing semantic search...")
+            
+            return_metadata = ("certainty", "distance")
+            scope = (self.collection_name, limit, return_metadata)
+            results = self.query_cache.lookup(query, scope) if self.query_cache else None
+            
+            if results is None:
+                collection = self.async_client.collections.get(self.collection_name)
+                results = await collection.query.near_text(
+                    query=query,
+                    limit=limit,
+                    return_metadata=list(return_metadata)
+                )
+                if self.query_cache is not None:
+                    self.query_cache.store(query, scope, results)
+            
+            return self._report_search(results)
+                
+        except Exception as e:
+            logger.error("❌ Semantic search test failed: %s", e)
+            return False
+    
+    @staticmethod
+    def _report_search(results) -> bool:
+        if results.objects:
+            logger.info("✅ Semantic search returned %s results", len(results.objects))
+            for obj in results.objects:
+                certainty = obj.metadata.certainty if obj.metadata else "unknown"
+                logger.info("  - %s (certainty: %s)", obj.properties.get('business_name', 'Unknown'), certainty)
+            return True
+        else:
+            logger.warning("⚠️  Semantic search returned no results (collection may be empty)")
+            return True  # Still valid if empty
+    
     def close(self):
-        """Close Weaviate connection"""
-        if self.client:
+        """Close a fresh connection; pooled clients stay open until exit"""
+        if self.client and not self._pooled:
             self.client.close()
-            print("🔌 Weaviate connection closed")
+            logger.info("🔌 Weaviate connection closed")
+        self.client = None
+        self._collection = None
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
+            self.embedding_cache = None
+    
+    async def aclose(self):
+        """Close the async client opened by aconnect()"""
+        if self.async_client:
+            await self.async_client.close()
+            logger.info("🔌 Weaviate async connection closed")
+        self.async_client = None
+
+
+async def async_bring_up(
+    setup: WeaviateSchemaSetup,
+    reset: bool,
+    insert_sample: bool,
+    objects: Optional[List[Dict[str, Any]]] = None,
+    search_repeat: int = 1
+) -> bool:
+    """
+    Create the collection, then load sample data while a throwaway query
+    warms the vectorizer, all over one async client.
+    """
+    if not await setup.aconnect():
+        return False
+    
+    try:
+        if not await setup.acreate_schema(reset=reset):
+            return False
+        
+        if insert_sample:
+            objects = objects if objects is not None else SAMPLE_BUSINESSES
+            logger.info("📝 Inserting %s sample objects...", len(objects))
+            inserted, _ = await asyncio.gather(
+                setup.abulk_insert(objects),
+                setup.aprewarm_vectorizer()
+            )
+            if inserted == len(objects):
+                logger.info("✅ Inserted %s sample objects", inserted)
+            else:
+                logger.error("❌ Inserted %s of %s sample objects", inserted, len(objects))
+            for _ in range(search_repeat):
+                await setup.atest_semantic_search()
+        return True
+    finally:
+        await setup.aclose()
 
 
 def main():
@@ -516,27 +1071,59 @@ def main():
     parser.add_argument("--reset", action="store_true", help="Delete existing collection and recreate")
     parser.add_argument("--validate-only", action="store_true", help="Only validate existing schema")
     parser.add_argument("--insert-sample", action="store_true", help="Insert sample data for testing")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Create the schema and insert sample data with the async client")
+    parser.add_argument("--client-side-embed", action="store_true",
+                        help="Embed inserted objects locally with a persistent cache instead of on the server")
+    parser.add_argument("--cache", action="store_true",
+                        help="Cache test search results so repeating the exact same query skips near_text")
+    parser.add_argument("--search-repeat", type=int, default=1, metavar="N",
+                        help="Run the test search N times after inserting sample data (default: 1)")
+    parser.add_argument("--sample-file", type=Path,
+                        help="JSON array or JSON Lines file to insert instead of the built-in samples")
+    parser.add_argument("--dump-schema", type=Path, metavar="PATH",
+                        help="Write the generated schema as JSON to PATH and exit")
     parser.add_argument("--url", help="Weaviate URL (default: from WEAVIATE_URL env)")
     parser.add_argument("--api-key", help="Weaviate API key (default: from WEAVIATE_API_KEY env)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only report warnings and errors")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Also report per-property checks")
+    parser.add_argument("--quantization", choices=sorted(_VECTOR_INDEX_CONFIGS), default="sq",
+                        help="Vector index compression for a newly created collection (default: sq)")
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO, format="%(message)s")
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
     
-    print("🚀 Weaviate Schema Setup for Legacy Business Registry")
-    print("=" * 60)
+    logger.info("🚀 Weaviate Schema Setup for Legacy Business Registry")
+    logger.info("=" * 60)
+    
+    if args.dump_schema:
+        schema = WeaviateSchemaSetup(quantization=args.quantization).get_legacy_business_schema()
+        args.dump_schema.write_bytes(dump_json(schema))
+        logger.info("✅ Wrote %s schema to %s", schema['class'], args.dump_schema)
+        return
+    
+    objects = prepare_objects(load_objects(args.sample_file)) if args.sample_file else None
     
     # Check environment
     url = args.url or os.getenv("WEAVIATE_URL")
     api_key = args.api_key or os.getenv("WEAVIATE_API_KEY")
     
     if not url:
-        print("❌ WEAVIATE_URL not set. Please provide --url or set environment variable.")
+        logger.error("❌ WEAVIATE_URL not set. Please provide --url or set environment variable.")
         sys.exit(1)
     
     if not api_key:
-        print("⚠️  WEAVIATE_API_KEY not set. Attempting connection without authentication.")
+        logger.warning("⚠️  WEAVIATE_API_KEY not set. Attempting connection without authentication.")
     
     # Initialize setup
-    setup = WeaviateSchemaSetup(url, api_key)
+    setup = WeaviateSchemaSetup(
+        url, api_key,
+        quantization=args.quantization,
+        enable_cache=args.cache,
+        client_side_embed=args.client_side_embed
+    )
     
     try:
         # Connect
@@ -545,37 +1132,53 @@ def main():
         
         if args.validate_only:
             # Validation only
-            if setup.validate_schema():
-                stats = setup.get_collection_stats()
-                print(f"📊 Collection stats: {stats}")
-                print("✅ Validation successful")
+            valid, stats = setup.validate_with_stats()
+            if valid:
+                logger.info("📊 Collection stats: %s", stats)
+                logger.info("✅ Validation successful")
+            else:
+                logger.error("❌ Validation failed")
+                sys.exit(1)
+        elif args.use_async:
+            # Full setup over the async client, then validate
+            if not asyncio.run(async_bring_up(setup, args.reset, args.insert_sample, objects, args.search_repeat)):
+                logger.error("❌ Schema creation failed")
+                sys.exit(1)
+            valid, stats = setup.validate_with_stats()
+            if valid:
+                logger.info("📊 Collection stats: %s", stats)
+                logger.info("✅ Schema setup completed successfully")
             else:
-                print("❌ Validation failed")
+                logger.error("❌ Schema validation failed after creation")
                 sys.exit(1)
         else:
             # Full setup
             if setup.create_schema(reset=args.reset):
-                if setup.validate_schema():
-                    stats = setup.get_collection_stats()
-                    print(f"📊 Collection stats: {stats}")
+                valid, stats = setup.validate_with_stats()
+                if valid:
+                    logger.info("📊 Collection stats: %s", stats)
                     
                     if args.insert_sample:
-                        setup.insert_sample_data()
-                        setup.test_semantic_search()
+                        setup.insert_sample_data(objects)
+                        for _ in range(args.search_repeat):
+                            setup.test_semantic_search()
                     
-                    print("✅ Schema setup completed successfully")
+                    logger.info("✅ Schema setup completed successfully")
                 else:
-                    print("❌ Schema validation failed after creation")
+                    logger.error("❌ Schema validation failed after creation")
                     sys.exit(1)
             else:
-                print("❌ Schema creation failed")
+                logger.error("❌ Schema creation failed")
                 sys.exit(1)
                 
+        if setup.query_cache is not None:
+            logger.info("🗄️  Search cache: %s", setup.query_cache.stats())
+                
     except KeyboardInterrupt:
-        print("\n⏹️  Setup interrupted by user")
+        logger.warning("\n⏹️  Setup interrupted by user")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        logger.error("❌ Unexpected error: %s", e)
         sys.exit(1)
     finally:
         setup.close()
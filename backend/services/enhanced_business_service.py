@@ -9,18 +9,109 @@ Production-ready service demonstrating the full RAG system architecture:
 - Vector search simulation
 """
 
+import re
 import json
+import math
+import heapq
+import bisect
+import zlib
 import random
+from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from models.legacy_business import (
     LegacyBusiness, LegacyBusinessSummary, LegacyBusinessSearch,
     LocationHistory, Recognition, OwnershipHistory,
     NeighborhoodEnum, BusinessStatusEnum, RAGWeightEnum
 )
 
+# Relevance weight for a query hit in each free-text field; the fields are
+# lowercased once per business into columns indexed by business id
+_FIELD_WEIGHTS = {
+    "founding_story": 3.0,
+    "cultural_significance": 3.0,
+    "community_impact": 3.0,
+    "physical_traditions": 2.0,
+    "historical_significance": 2.0,
+    "business_name": 4.0,
+    "business_type": 2.0,
+}
+# Weight per matching unique feature or demo highlight
+_TAG_WEIGHT = 1.5
+
+_WORD_RE = re.compile(r"\w+")
+
+# Simulated embedding width (768 dimensions like OpenAI)
+EMBEDDING_DIM = 768
+
+class SearchTokenIndex:
+    """
+    Inverted index from word token to the businesses, and the fields within
+    them, that contain it.
+    
+    A single-word query occurs in a text exactly when it occurs inside one
+    of the text's word tokens, so a search scans the (deduplicated)
+    vocabulary once instead of every field of every business. Each posting
+    is a bitmask of hit slots: one bit per weighted field, then one per
+    feature/highlight entry, so a field counts once however many of its
+    tokens match and each matching entry still counts separately.
+    """
+    
+    def __init__(self, field_weights: List[float], tag_weight: float):
+        self._field_weights = field_weights
+        self._tag_weight = tag_weight
+        self._postings: Dict[str, Dict[int, int]] = defaultdict(dict)
+        self._vocabulary = None  # ("\n"-joined tokens, start offsets, tokens)
+    
+    def add(self, business_id: int, fields: List[str], tags: List[str]):
+        """Index a business's lowercased field texts and tag entries"""
+        for slot, text in enumerate((*fields, *tags)):
+            for token in _WORD_RE.findall(text):
+                postings = self._postings[token]
+                postings[business_id] = postings.get(business_id, 0) | (1 << slot)
+        self._vocabulary = None
+    
+    def _tokens_containing(self, word: str) -> List[str]:
+        if self._vocabulary is None:
+            tokens = list(self._postings)
+            offsets, position = [], 0
+            for token in tokens:
+                offsets.append(position)
+                position += len(token) + 1
+            self._vocabulary = ("\n".join(tokens), offsets, tokens)
+        
+        blob, offsets, tokens = self._vocabulary
+        found = {}
+        start = blob.find(word)
+        while start != -1:
+            index = bisect.bisect_right(offsets, start) - 1
+            found[index] = tokens[index]
+            # Continue after this token; later hits inside it add nothing
+            start = blob.find(word, offsets[index] + len(tokens[index]) + 1)
+        return list(found.values())
+    
+    def scores(self, word: str) -> Dict[int, float]:
+        """Weighted hit score per business id for a single lowercase word"""
+        masks: Dict[int, int] = {}
+        for token in self._tokens_containing(word):
+            for business_id, mask in self._postings[token].items():
+                masks[business_id] = masks.get(business_id, 0) | mask
+        
+        num_fields = len(self._field_weights)
+        scores = {}
+        for business_id, mask in masks.items():
+            score = sum(weight for slot, weight in enumerate(self._field_weights) if mask >> slot & 1)
+            scores[business_id] = score + self._tag_weight * bin(mask >> num_fields).count("1")
+        return scores
+
 class EnhancedBusinessService:
     """
     Enhanced business service showcasing RAG system capabilities.
@@ -35,9 +126,15 @@ class EnhancedBusinessService:
     
     def __init__(self):
         self.businesses: List[LegacyBusiness] = []
-        self.vector_embeddings: Dict[str, List[float]] = {}  # Simulated embeddings
+        self.vector_embeddings: Dict[str, int] = {}  # business_name -> row of embedding_matrix
+        self.embedding_matrix = None  # Simulated embeddings, (N, EMBEDDING_DIM) float32 with numpy
+        self._embedding_norms = None
+        # Lowercased search text, one list entry per business id
+        self._search_columns: Dict[str, List[Any]] = {field: [] for field in (*_FIELD_WEIGHTS, "tags")}
+        self.token_index = SearchTokenIndex(list(_FIELD_WEIGHTS.values()), _TAG_WEIGHT)
         self._load_enhanced_mock_data()
         self._simulate_vector_embeddings()
+        self._build_indexes()
     
     def _load_enhanced_mock_data(self):
         """Load rich mock data showcasing RAG system potential"""
@@ -350,36 +447,106 @@ class EnhancedBusinessService:
         
         self.businesses = [wok_shop, molinari, city_lights]
     
+    def _build_indexes(self):
+        """Index search text by position in self.businesses"""
+        for business_id, business in enumerate(self.businesses):
+            self._index_search_text(business_id, business)
+    
+    def _index_search_text(self, business_id: int, business: LegacyBusiness):
+        """Append a business's lowercased text to the search columns ("" when unset)"""
+        columns = self._search_columns
+        for field in _FIELD_WEIGHTS:
+            columns[field].append((getattr(business, field) or "").lower())
+        columns["tags"].append(tuple(
+            tag.lower() for tag in (*business.unique_features, *business.demo_highlights)
+        ))
+        self.token_index.add(
+            business_id,
+            [columns[field][business_id] for field in _FIELD_WEIGHTS],
+            columns["tags"][business_id]
+        )
+    
+    def _relevance_scores(self, query_lower: str, rows: List[int]):
+        """
+        Weighted keyword-hit score for each row. Single-word queries are
+        answered from the token index; phrases fall back to a (fields x rows)
+        substring hit matrix reduced against the weight vector, or plain sums
+        without numpy.
+        """
+        if _WORD_RE.fullmatch(query_lower):
+            by_row = self.token_index.scores(query_lower)
+            scores = [by_row.get(row, 0.0) for row in rows]
+            return np.array(scores, dtype=np.float64) if NUMPY_AVAILABLE else scores
+        
+        columns = self._search_columns
+        hits = [[query_lower in columns[field][row] for row in rows] for field in _FIELD_WEIGHTS]
+        tag_hits = [sum(query_lower in tag for tag in columns["tags"][row]) for row in rows]
+        
+        if NUMPY_AVAILABLE:
+            weights = np.fromiter(_FIELD_WEIGHTS.values(), dtype=np.float64)
+            return weights @ np.array(hits, dtype=np.float64).reshape(len(weights), len(rows)) + \
+                _TAG_WEIGHT * np.array(tag_hits, dtype=np.float64)
+        return [
+            sum(weight for weight, field_hits in zip(_FIELD_WEIGHTS.values(), hits) if field_hits[i]) +
+            _TAG_WEIGHT * tag_hits[i]
+            for i in range(len(rows))
+        ]
+    
     def _simulate_vector_embeddings(self):
         """Simulate vector embeddings for semantic search demonstration"""
         
         # In a real implementation, these would be actual embeddings from OpenAI/etc.
         # For demo purposes, we simulate embeddings as random vectors with some logic
+        businesses = self.businesses
+        
+        # (members, dimensions, bias): semantic clustering for similar businesses
+        clusters = (
+            # Food businesses cluster together
+            ([bool(b.business_type) and "food" in b.business_type.lower() for b in businesses], slice(0, 100), 0.3),
+            # North Beach businesses cluster together
+            ([b.neighborhood == NeighborhoodEnum.NORTH_BEACH for b in businesses], slice(100, 200), 0.2),
+            # Historic businesses cluster together
+            ([bool(b.founding_year and b.founding_year < 1920) for b in businesses], slice(200, 300), 0.4),
+        )
         
-        for business in self.businesses:
-            # Create pseudo-embeddings based on business characteristics
-            embedding = []
-            
-            # Simulate embeddings based on content (768 dimensions like OpenAI)
-            base_vector = [random.uniform(-1, 1) for _ in range(768)]
-            
-            # Add semantic clustering for similar businesses
-            if "food" in business.business_type.lower():
-                # Food businesses cluster together
-                for i in range(100):
-                    base_vector[i] += 0.3
-            
-            if business.neighborhood == NeighborhoodEnum.NORTH_BEACH:
-                # North Beach businesses cluster together
-                for i in range(100, 200):
-                    base_vector[i] += 0.2
-            
-            if business.founding_year and business.founding_year < 1920:
-                # Historic businesses cluster together
-                for i in range(200, 300):
-                    base_vector[i] += 0.4
-            
-            self.vector_embeddings[business.business_name] = base_vector
+        if NUMPY_AVAILABLE:
+            rng = np.random.default_rng()
+            matrix = rng.uniform(-1, 1, size=(len(businesses), EMBEDDING_DIM)).astype(np.float32)
+            for members, dimensions, bias in clusters:
+                matrix[np.array(members, dtype=bool), dimensions] += bias
+        else:
+            matrix = [[random.uniform(-1, 1) for _ in range(EMBEDDING_DIM)] for _ in businesses]
+            for members, dimensions, bias in clusters:
+                for row, member in zip(matrix, members):
+                    if member:
+                        for i in range(dimensions.start, dimensions.stop):
+                            row[i] += bias
+        
+        self.embedding_matrix = matrix
+        self._embedding_norms = (
+            np.linalg.norm(matrix, axis=1) if NUMPY_AVAILABLE
+            else [math.sqrt(sum(x * x for x in row)) for row in matrix]
+        )
+        self.vector_embeddings = {business.business_name: row for row, business in enumerate(businesses)}
+    
+    def _query_similarities(self, query: str):
+        """
+        Cosine similarity between the query's simulated embedding and every
+        embedding_matrix row, as one matrix-vector product. The query vector
+        is seeded from the query text, so repeated searches score the same.
+        """
+        seed = zlib.crc32(query.lower().encode())
+        if NUMPY_AVAILABLE:
+            query_vec = np.random.default_rng(seed).uniform(-1, 1, EMBEDDING_DIM).astype(np.float32)
+            return (self.embedding_matrix @ query_vec) / (self._embedding_norms * np.linalg.norm(query_vec))
+        
+        rng = random.Random(seed)
+        query_vec = [rng.uniform(-1, 1) for _ in range(EMBEDDING_DIM)]
+        query_norm = math.sqrt(sum(x * x for x in query_vec))
+        return [
+            sum(a * b for a, b in zip(row, query_vec)) / (norm * query_norm)
+            for row, norm in zip(self.embedding_matrix, self._embedding_norms)
+        ]
     
     def get_businesses(self, limit: int = 10) -> List[LegacyBusiness]:
         """Get all businesses with limit"""
@@ -398,88 +565,58 @@ class EnhancedBusinessService:
         Demonstrates RAG system foundations with semantic similarity.
         """
         
-        # Start with all businesses
-        candidates = self.businesses.copy()
-        
-        # Apply filters
-        if search_query.neighborhood:
-            candidates = [b for b in candidates if b.neighborhood == search_query.neighborhood]
-        
-        if search_query.business_type:
-            candidates = [b for b in candidates if 
-                         search_query.business_type.lower() in b.business_type.lower()]
-        
-        if search_query.founding_year_min:
-            candidates = [b for b in candidates if 
-                         b.founding_year and b.founding_year >= search_query.founding_year_min]
-        
-        if search_query.founding_year_max:
-            candidates = [b for b in candidates if 
-                         b.founding_year and b.founding_year <= search_query.founding_year_max]
+        # Apply all filters in one pass; an unset (falsy) filter matches everything
+        neighborhood = search_query.neighborhood
+        business_type = (search_query.business_type or "").lower()
+        year_min = search_query.founding_year_min
+        year_max = search_query.founding_year_max
+        heritage_min = search_query.heritage_score_min
+        type_column = self._search_columns["business_type"]
+        
+        def keep(row: int, b: LegacyBusiness) -> bool:
+            return (
+                (not neighborhood or b.neighborhood == neighborhood)
+                and (not business_type or business_type in type_column[row])
+                and (not year_min or (b.founding_year and b.founding_year >= year_min))
+                and (not year_max or (b.founding_year and b.founding_year <= year_max))
+                and (not heritage_min or (b.heritage_score and b.heritage_score >= heritage_min))
+            )
         
-        if search_query.heritage_score_min:
-            candidates = [b for b in candidates if 
-                         b.heritage_score and b.heritage_score >= search_query.heritage_score_min]
+        # Business ids index the search columns and embedding rows
+        rows = [row for row, b in enumerate(self.businesses) if keep(row, b)]
+        candidates = [self.businesses[row] for row in rows]
         
         # Simulate semantic search
         if search_query.query.strip():
-            scored_candidates = []
-            
-            for business in candidates:
-                # Calculate relevance score based on RAG weights
-                score = 0.0
-                query_lower = search_query.query.lower()
-                
-                # High weight fields (founding_story, cultural_significance)
-                if business.founding_story and query_lower in business.founding_story.lower():
-                    score += 3.0
-                if business.cultural_significance and query_lower in business.cultural_significance.lower():
-                    score += 3.0
-                if business.community_impact and query_lower in business.community_impact.lower():
-                    score += 3.0
-                
-                # Medium weight fields
-                if business.physical_traditions and query_lower in business.physical_traditions.lower():
-                    score += 2.0
-                if business.historical_significance and query_lower in business.historical_significance.lower():
-                    score += 2.0
-                
-                # Business name gets high weight
-                if query_lower in business.business_name.lower():
-                    score += 4.0
-                
-                # Business type gets medium weight
-                if query_lower in business.business_type.lower():
-                    score += 2.0
-                
-                # Features and highlights
-                for feature in business.unique_features:
-                    if query_lower in feature.lower():
-                        score += 1.5
-                
-                for highlight in business.demo_highlights:
-                    if query_lower in highlight.lower():
-                        score += 1.5
-                
-                # Simulate vector similarity (cosine similarity)
-                if business.business_name in self.vector_embeddings:
-                    # In real implementation, would calculate actual cosine similarity
-                    vector_similarity = random.uniform(0.1, 0.9)
-                    if vector_similarity > search_query.similarity_threshold:
-                        score += vector_similarity * 2.0
-                
-                if score > 0:
-                    scored_candidates.append((business, score))
-            
-            # Sort by relevance score
-            scored_candidates.sort(key=lambda x: x[1], reverse=True)
-            candidates = [business for business, score in scored_candidates]
-        
-        # Apply pagination
-        total_results = len(candidates)
-        start_idx = search_query.offset
-        end_idx = start_idx + search_query.limit
-        results = candidates[start_idx:end_idx]
+            scores = self._relevance_scores(search_query.query.lower(), rows)
+            
+            # Vector similarity bonus for businesses with an embedding
+            similarities = self._query_similarities(search_query.query)
+            for i, row in enumerate(rows):
+                if row < len(similarities) and similarities[row] > search_query.similarity_threshold:
+                    scores[i] += float(similarities[row]) * 2.0
+            
+            # Rank matches by relevance score, ties in filter order. Only the
+            # requested page is needed, so select it with a bounded heap
+            # unless every match falls inside it anyway.
+            if NUMPY_AVAILABLE:
+                matched = np.flatnonzero(scores > 0).tolist()
+                scores = scores.tolist()
+            else:
+                matched = [i for i, score in enumerate(scores) if score > 0]
+            total_results = len(matched)
+            needed = search_query.offset + search_query.limit
+            if total_results > needed:
+                ranked = heapq.nlargest(needed, matched, key=scores.__getitem__)
+            else:
+                ranked = sorted(matched, key=scores.__getitem__, reverse=True)
+            results = [candidates[i] for i in ranked[search_query.offset:]]
+        else:
+            # Apply pagination
+            total_results = len(candidates)
+            start_idx = search_query.offset
+            end_idx = start_idx + search_query.limit
+            results = candidates[start_idx:end_idx]
         
         return {
             "results": results,
@@ -506,12 +643,12 @@ class EnhancedBusinessService:
             LegacyBusinessSummary(
                 business_name=b.business_name,
                 founding_year=b.founding_year,
-                neighborhood=b.neighborhood.value if b.neighborhood else None,
+                neighborhood=b.neighborhood,
                 business_type=b.business_type,
                 unique_features=b.unique_features[:3],  # Top 3 features
                 demo_highlights=b.demo_highlights[:3],  # Top 3 highlights
                 heritage_score=b.heritage_score,
-                current_status=b.current_status.value
+                current_status=b.current_status
             )
             for b in businesses
         ]
@@ -522,7 +659,7 @@ class EnhancedBusinessService:
         
         for business in self.businesses:
             if business.neighborhood:
-                neighborhood = business.neighborhood.value
+                neighborhood = business.neighborhood
                 neighborhood_counts[neighborhood] = neighborhood_counts.get(neighborhood, 0) + 1
         
         return neighborhood_counts
@@ -43,7 +43,7 @@ FRIENDLI_AVAILABLE = False
 LIVE_IMPORTS_AVAILABLE = OPENAI_AVAILABLE and LLAMAPARSE_AVAILABLE
 
 # Local imports
-from models.legacy_business import LegacyBusiness, LegacyBusinessExtracted, ExtractionMetadata
+from models.legacy_business import LegacyBusiness, LegacyBusinessExtracted, LegacyBusinessMutable, ExtractionMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -197,7 +197,7 @@ class PDFProcessingService:
         
         try:
             self.extraction_program = LLMTextCompletionProgram.from_defaults(
-                output_cls=LegacyBusiness,
+                output_cls=LegacyBusinessMutable,
                 llm=self.llm,
                 prompt_template_str=extraction_prompt,
                 verbose=True
@@ -372,7 +372,7 @@ Return the structured data following the LegacyBusiness model schema.
         
         # Create LegacyBusiness object for validation
         try:
-            business_obj = LegacyBusiness(**mock_business)
+            business_obj = LegacyBusiness.from_untrusted(mock_business)
             business_dict = business_obj.model_dump()
         except ValidationError as e:
             logger.error(f"❌ Mock data validation failed: {e}")
@@ -432,7 +432,7 @@ Return the structured data following the LegacyBusiness model schema.
         try:
             logger.info("🧠 Extracting structured data with LLM")
             
-            # Run extraction program
+            # Run extraction program; the draft is validated once at the end
             extracted_data = self.extraction_program(pdf_content=pdf_content)
             
             # Add metadata
@@ -457,14 +457,14 @@ Return the structured data following the LegacyBusiness model schema.
                     extraction_method="llama_parse_openai"
                 )
                 
-                # Return enhanced model with metadata
+                # Return enhanced model with metadata (validates the draft)
                 return LegacyBusinessExtracted(
                     **extracted_data.model_dump(),
                     extraction_metadata=extraction_metadata,
                     raw_extracted_text=pdf_content[:1000] + "..." if len(pdf_content) > 1000 else pdf_content
                 )
             
-            return extracted_data
+            return extracted_data.finalize()
             
         except Exception as e:
             logger.error(f"❌ Structured extraction failed: {e}")
@@ -526,9 +526,9 @@ Return the structured data following the LegacyBusiness model schema.
             if value is not None:
                 if isinstance(value, str) and value.strip():
                     populated.append(field_name)
-                elif isinstance(value, list) and len(value) > 0:
+                elif isinstance(value, (list, tuple)) and len(value) > 0:
                     populated.append(field_name)
-                elif not isinstance(value, (str, list)):
+                elif not isinstance(value, (str, list, tuple)):
                     populated.append(field_name)
         
         return populated
@@ -0,0 +1,103 @@
+"""
+Semantic Response Cache for Weaviate Endpoints
+==============================================
+
+Caches serialized search and question-answering payloads in front of
+Weaviate so repeated queries skip the round-trip.
+
+Queries are lowercased and their whitespace collapsed before keying, so
+"Chinese  cooking" and "chinese cooking" share an entry. Word order and
+punctuation are kept: "not a bakery in chinatown" and "a bakery not in
+chinatown" rank differently and must not share results. Filters are part
+of the key, and entries expire after `ttl` seconds so fresh ingests
+become visible without an explicit flush.
+Singleflight complements the cache on misses: concurrent identical
+requests share one backend call instead of stampeding it.
+"""
+
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase a query and collapse runs of whitespace"""
+    return " ".join(query.lower().split())
+
+
+class SemanticCache:
+    """Bounded LRU of response payloads keyed by normalized query and filters"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(query: str, filters: Hashable = ()) -> Tuple[str, Hashable]:
+        return normalize_query(query), filters
+
+    def lookup(self, query: str, filters: Hashable = ()) -> Optional[Any]:
+        """Return the cached payload for an equivalent query, or None"""
+        key = self.key(query, filters)
+        entry = self._data.get(key)
+        if entry is not None:
+            payload, expires_at = entry
+            if expires_at >= time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return payload
+            del self._data[key]
+        self.misses += 1
+        return None
+
+    def store(self, query: str, filters: Hashable, payload: Any):
+        """Cache an already-serialized payload for this query and filter set"""
+        key = self.key(query, filters)
+        self._data[key] = (payload, time.monotonic() + self.ttl)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self):
+        return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class Singleflight:
+    """
+    Coalesce concurrent calls that share a key.
+
+    The first caller starts the work; callers arriving while it is in flight
+    await the same future instead of issuing a duplicate backend request.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        pending = self._calls.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(factory())
+            self._calls[key] = pending
+            pending.add_done_callback(lambda fut: self._forget(key, fut))
+        # Shield so one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(pending)
+
+    def _forget(self, key: Hashable, fut: asyncio.Future):
+        if self._calls.get(key) is fut:
+            del self._calls[key]
+
+    def __len__(self) -> int:
+        return len(self._calls)
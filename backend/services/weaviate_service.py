@@ -16,7 +16,9 @@ import os
 import json
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Union, Tuple
+import time
+import tempfile
+from typing import AsyncIterator, Dict, Any, List, Optional, Union, Tuple
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from enum import Enum
@@ -29,10 +31,19 @@ try:
 except ImportError:
     WEAVIATE_AVAILABLE = False
 
-from models.legacy_business import LegacyBusiness, LegacyBusinessSummary, LegacyBusinessSearch, NeighborhoodEnum
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from models.legacy_business import LegacyBusiness, LegacyBusinessSummary, LegacyBusinessSearch, NeighborhoodEnum, validate_summary
 
 logger = logging.getLogger(__name__)
 
+# Seconds before the live service reloads its local copy of business vectors
+VECTOR_INDEX_TTL = 300.0
+
 
 class SearchMode(str, Enum):
     """Search operation modes"""
@@ -83,12 +94,101 @@ class SearchResponse:
         return sum(r.confidence for r in self.results) / len(self.results)
 
 
+def quantize_embeddings(matrix: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Symmetric per-row int8 quantization.
+    
+    Each row is scaled by 127 / max(|row|); returns the int8 codes and the
+    float32 factor that maps codes back to the original units.
+    """
+    peak = np.abs(matrix).max(axis=1)
+    peak[peak == 0] = 1.0
+    codes = np.rint(matrix * (127.0 / peak)[:, None]).astype(np.int8)
+    return np.ascontiguousarray(codes), (peak / 127.0).astype(np.float32)
+
+
+def spill_to_disk(matrix: "np.ndarray") -> "np.ndarray":
+    """
+    Copy a matrix into a memory map over an anonymous temporary file.
+    
+    Rows read back through the map are paged in on demand, so rarely
+    touched data stays out of resident memory.
+    """
+    if not matrix.size:
+        return matrix
+    with tempfile.TemporaryFile() as handle:
+        spilled = np.memmap(handle, dtype=matrix.dtype, mode="w+", shape=matrix.shape)
+    # The map holds its own descriptor, so it outlives the closed file
+    spilled[:] = matrix
+    return spilled
+
+
+class BusinessVectorIndex:
+    """
+    L2-normalized business embeddings stored as one contiguous int8 matrix.
+    
+    The scanned int8 codes take a quarter of the memory of float32, and
+    cosine similarity against every row is a single int32-accumulated
+    matrix-vector product rescaled by the per-row factors, with no
+    Python loop over candidates. That coarse pass keeps RERANK_FACTOR
+    candidates per requested result, which are then rescored exactly
+    against the float32 vectors so quantization error can't reorder
+    the final results. Only those few rows are read at full precision,
+    so the float32 copy is spilled to a disk-backed map rather than
+    kept resident next to the codes.
+    """
+    
+    RERANK_FACTOR = 4
+    
+    def __init__(self, businesses: List[LegacyBusinessSummary], vectors: List[List[float]]):
+        self.businesses = businesses
+        self._rows = {b.business_name.lower(): i for i, b in enumerate(businesses)}
+        
+        matrix = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        self.codes, self.scales = quantize_embeddings(matrix)
+        self._rerank_vectors = spill_to_disk(matrix)
+    
+    def __len__(self) -> int:
+        return len(self.businesses)
+    
+    def similar(self, business_name: str, limit: int) -> List[Tuple[LegacyBusinessSummary, float]]:
+        """Top `limit` businesses by cosine similarity to `business_name`, excluding itself"""
+        row = self._rows.get(business_name.lower())
+        if row is None or limit <= 0:
+            return []
+        
+        dots = np.einsum("ij,j->i", self.codes, self.codes[row], dtype=np.int32, casting="unsafe")
+        scores = dots * (self.scales * self.scales[row])
+        scores[row] = -np.inf
+        
+        k = min(limit, len(self.businesses) - 1)
+        if k <= 0:
+            return []
+        coarse_k = min(k * self.RERANK_FACTOR, len(self.businesses) - 1)
+        candidates = np.argpartition(-scores, coarse_k - 1)[:coarse_k]
+        
+        exact = self._rerank_vectors[candidates] @ self._rerank_vectors[row]
+        order = np.argsort(-exact)[:k]
+        return [(self.businesses[candidates[i]], float(exact[i])) for i in order]
+
+
 class MockWeaviateService:
     """Mock Weaviate service for development and demo environments"""
     
     def __init__(self):
         self.mock_businesses = self._load_mock_data()
-        logger.info(f"MockWeaviateService initialized with {len(self.mock_businesses)} businesses")
+        # Built once so each summary's cached json_dict is reused across requests
+        self._summaries = [LegacyBusinessSummary.from_trusted(data) for data in self.mock_businesses]
+        logger.info("MockWeaviateService initialized with %s businesses", len(self.mock_businesses))
+    
+    async def ensure_connected(self) -> None:
+        """Mock data is always available"""
+    
+    def close(self):
+        """Nothing to release in mock mode"""
     
     def _load_mock_data(self) -> List[Dict[str, Any]]:
         """Load realistic mock data that matches our LegacyBusiness model"""
@@ -157,10 +257,12 @@ class MockWeaviateService:
     
     async def list_all_businesses(self, limit: int = 50) -> List[LegacyBusinessSummary]:
         """List all businesses with optional limit"""
-        businesses = []
-        for business_data in self.mock_businesses[:limit]:
-            businesses.append(LegacyBusinessSummary(**business_data))
-        return businesses
+        return self._summaries[:limit]
+    
+    async def iter_all_businesses(self, limit: int = 50) -> AsyncIterator[LegacyBusinessSummary]:
+        """Yield businesses one at a time"""
+        for summary in self._summaries[:limit]:
+            yield summary
     
     async def search_businesses(self, search_request: LegacyBusinessSearch) -> SearchResponse:
         """Mock semantic search with realistic scoring"""
@@ -169,7 +271,7 @@ class MockWeaviateService:
         query_lower = search_request.query.lower()
         results = []
         
-        for business_data in self.mock_businesses:
+        for business_data, summary in zip(self.mock_businesses, self._summaries):
             # Calculate mock relevance score
             score = self._calculate_mock_relevance(business_data, query_lower)
             
@@ -180,7 +282,7 @@ class MockWeaviateService:
             # Only include results above similarity threshold
             if score >= search_request.similarity_threshold:
                 result = SearchResult(
-                    business=LegacyBusinessSummary(**business_data),
+                    business=summary,
                     score=score,
                     certainty=score,  # Mock certainty as score
                     search_mode=SearchMode.SEMANTIC.value
@@ -257,7 +359,7 @@ class MockWeaviateService:
         """Check if business passes search filters"""
         # Neighborhood filter
         if search_request.neighborhood:
-            if business_data.get("neighborhood") != search_request.neighborhood.value:
+            if business_data.get("neighborhood") != search_request.neighborhood:
                 return False
         
         # Business type filter
@@ -283,9 +385,9 @@ class MockWeaviateService:
     
     async def get_business_by_name(self, name: str) -> Optional[LegacyBusinessSummary]:
         """Get business by exact name match"""
-        for business_data in self.mock_businesses:
+        for business_data, summary in zip(self.mock_businesses, self._summaries):
             if business_data["business_name"].lower() == name.lower():
-                return LegacyBusinessSummary(**business_data)
+                return summary
         return None
     
     async def get_similar_businesses(self, business_name: str, limit: int = 5) -> List[SearchResult]:
@@ -305,7 +407,7 @@ class MockWeaviateService:
         target_type = target_business.get("business_type", "").lower()
         target_neighborhood = target_business.get("neighborhood", "")
         
-        for business_data in self.mock_businesses:
+        for business_data, summary in zip(self.mock_businesses, self._summaries):
             if business_data["business_name"] == target_business["business_name"]:
                 continue  # Skip self
             
@@ -332,7 +434,7 @@ class MockWeaviateService:
             
             if similarity >= 0.5:  # Minimum similarity threshold
                 result = SearchResult(
-                    business=LegacyBusinessSummary(**business_data),
+                    business=summary,
                     score=similarity,
                     certainty=similarity,
                     search_mode=SearchMode.SIMILARITY.value
@@ -369,6 +471,10 @@ class WeaviateService:
         self.client = None
         self.collection_name = "LegacyBusiness"
         self.is_connected = False
+        self._vector_index: Optional[BusinessVectorIndex] = None
+        self._vector_index_expires = 0.0
+        # Serializes reconnects so a burst of requests opens a single client
+        self._connect_lock = asyncio.Lock()
         
     async def connect(self) -> bool:
         """Establish connection to Weaviate"""
@@ -387,16 +493,24 @@ class WeaviateService:
             
             self.is_connected = self.client.is_ready()
             if self.is_connected:
-                logger.info(f"Connected to Weaviate at {self.url}")
+                logger.info("Connected to Weaviate at %s", self.url)
             else:
-                logger.warning(f"Weaviate not ready at {self.url}")
+                logger.warning("Weaviate not ready at %s", self.url)
             
             return self.is_connected
             
         except Exception as e:
-            logger.error(f"Failed to connect to Weaviate: {e}")
+            logger.error("Failed to connect to Weaviate: %s", e)
             return False
     
+    async def ensure_connected(self) -> None:
+        """Connect if needed, raising ConnectionError when Weaviate is unreachable"""
+        if self.is_connected:
+            return
+        async with self._connect_lock:
+            if not self.is_connected and not await self.connect():
+                raise ConnectionError(f"Cannot connect to Weaviate at {self.url}")
+    
     async def list_all_businesses(self, limit: int = 50) -> List[LegacyBusinessSummary]:
         """List all businesses from Weaviate"""
         if not self.client:
@@ -410,20 +524,45 @@ class WeaviateService:
                 include_vector=False
             )
             
-            businesses = []
-            for obj in response.objects:
-                # Convert Weaviate object to our model
-                business_data = obj.properties
-                businesses.append(LegacyBusinessSummary(**business_data))
-            
-            return businesses
+            # Convert Weaviate objects to our model
+            return [validate_summary(obj.properties) for obj in response.objects]
             
         except Exception as e:
-            logger.error(f"Failed to list businesses: {e}")
+            logger.error("Failed to list businesses: %s", e)
             raise
     
+    async def iter_all_businesses(self, limit: int = 50, page_size: int = 25) -> AsyncIterator[LegacyBusinessSummary]:
+        """Yield businesses page by page using Weaviate's cursor API"""
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected")
+        
+        collection = self.client.collections.get(self.collection_name)
+        after = None
+        remaining = limit
+        
+        while remaining > 0:
+            response = await asyncio.to_thread(
+                collection.query.fetch_objects,
+                limit=min(page_size, remaining),
+                after=after,
+                include_vector=False
+            )
+            if not response.objects:
+                return
+            
+            for obj in response.objects:
+                yield validate_summary(obj.properties)
+            
+            remaining -= len(response.objects)
+            after = response.objects[-1].uuid
+    
     async def search_businesses(self, search_request: LegacyBusinessSearch) -> SearchResponse:
         """Perform semantic search in Weaviate"""
+        # The v4 client call blocks; run it in a worker thread so concurrent
+        # searches overlap on the shared connection instead of serializing
+        return await asyncio.to_thread(self._search_businesses_sync, search_request)
+    
+    def _search_businesses_sync(self, search_request: LegacyBusinessSearch) -> SearchResponse:
         if not self.client:
             raise ConnectionError("Weaviate client not connected")
         
@@ -448,7 +587,7 @@ class WeaviateService:
                 distance = metadata.distance if metadata else None
                 
                 result = SearchResult(
-                    business=LegacyBusinessSummary(**obj.properties),
+                    business=validate_summary(obj.properties),
                     score=certainty or (1 - distance) if distance else 0.5,
                     certainty=certainty,
                     distance=distance,
@@ -468,9 +607,50 @@ class WeaviateService:
             )
             
         except Exception as e:
-            logger.error(f"Search failed: {e}")
+            logger.error("Search failed: %s", e)
             raise
     
+    async def get_similar_businesses(self, business_name: str, limit: int = 5) -> List[SearchResult]:
+        """Find businesses whose embeddings are closest to the given business"""
+        if not self.client:
+            raise ConnectionError("Weaviate client not connected")
+        
+        return await asyncio.to_thread(self._get_similar_businesses_sync, business_name, limit)
+    
+    def _get_similar_businesses_sync(self, business_name: str, limit: int) -> List[SearchResult]:
+        index = self._get_vector_index()
+        return [
+            SearchResult(
+                business=business,
+                score=similarity,
+                certainty=similarity,
+                search_mode=SearchMode.SIMILARITY.value
+            )
+            for business, similarity in index.similar(business_name, limit)
+        ]
+    
+    def _get_vector_index(self) -> BusinessVectorIndex:
+        """Load every business vector into a local index, refreshed every few minutes"""
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for similarity search")
+        
+        now = time.monotonic()
+        if self._vector_index is None or now >= self._vector_index_expires:
+            collection = self.client.collections.get(self.collection_name)
+            businesses, vectors = [], []
+            for obj in collection.iterator(include_vector=True):
+                vector = obj.vector.get("default") if isinstance(obj.vector, dict) else obj.vector
+                if not vector:
+                    continue
+                businesses.append(validate_summary(obj.properties))
+                vectors.append(vector)
+            
+            self._vector_index = BusinessVectorIndex(businesses, vectors)
+            self._vector_index_expires = now + VECTOR_INDEX_TTL
+            logger.info("Loaded %s business vectors for similarity search", len(businesses))
+        
+        return self._vector_index
+    
     def _build_where_filter(self, search_request: LegacyBusinessSearch) -> Optional[Dict]:
         """Build Weaviate where filter from search request"""
         filters = []
@@ -480,7 +660,7 @@ class WeaviateService:
             filters.append({
                 "path": ["neighborhood"],
                 "operator": "Equal",
-                "valueText": search_request.neighborhood.value
+                "valueText": search_request.neighborhood
             })
         
         # Business type filter
@@ -519,7 +699,7 @@ class WeaviateService:
             filters.append({
                 "path": ["current_status"],
                 "operator": "Equal",
-                "valueText": search_request.current_status.value
+                "valueText": search_request.current_status
             })
         
         if not filters:
@@ -541,11 +721,13 @@ class WeaviateService:
         try:
             collection = self.client.collections.get(self.collection_name)
             
-            # Get collection stats
-            total_count = collection.aggregate.over_all(total_count=True).total_count
-            
-            # Get collection config
-            config = collection.config.get()
+            # Collection stats and config are independent round trips; issue
+            # them concurrently so status costs the slower of the two
+            aggregate, config = await asyncio.gather(
+                asyncio.to_thread(collection.aggregate.over_all, total_count=True),
+                asyncio.to_thread(collection.config.get)
+            )
+            total_count = aggregate.total_count
             
             return {
                 "mode": "live",
@@ -603,7 +785,7 @@ class WeaviateServiceFactory:
             logger.info("Created WeaviateService (will test connection on first use)")
             return service
         except Exception as e:
-            logger.warning(f"Failed to create WeaviateService, using mock: {e}")
+            logger.warning("Failed to create WeaviateService, using mock: %s", e)
             return MockWeaviateService()
 
 
@@ -706,4 +888,17 @@ class WeaviateQueryAgent:
             "timeframe": timeframe,
             "analysis": "Historical trend analysis coming soon! Will include founding patterns, neighborhood evolution, and cultural impact trends.",
             "implementation_status": "stub"
-        }
\ No newline at end of file
+        }
+
+# Global query agent, rebuilt only if the underlying service changes
+_query_agent: Optional[WeaviateQueryAgent] = None
+
+def get_query_agent(
+    service: Optional[Union[WeaviateService, MockWeaviateService]] = None
+) -> WeaviateQueryAgent:
+    """Get global query agent bound to the Weaviate service"""
+    global _query_agent
+    service = service or get_weaviate_service()
+    if _query_agent is None or _query_agent.service is not service:
+        _query_agent = WeaviateQueryAgent(service)
+    return _query_agent